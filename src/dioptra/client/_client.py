@@ -17,12 +17,94 @@
 from __future__ import annotations
 
 import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from posixpath import join as urljoin
-from typing import Any, cast
+from typing import Any, Iterable, cast
 from urllib.parse import urlparse, urlunparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+POOL_CONNECTIONS: int = 10
+POOL_MAXSIZE: int = 20
+RETRY_TOTAL: int = 3
+RETRY_BACKOFF_FACTOR: float = 0.2
+MAX_PARALLEL_REQUESTS: int = 8
+QUEUE_CACHE_TTL_SECONDS: float = 5.0
+
+
+def _build_session() -> requests.Session:
+    """Build a session that reuses TCP/TLS connections across requests.
+
+    The session mounts a connection-pooling adapter for both the http:// and
+    https:// prefixes so that consecutive requests to the Dioptra REST api reuse
+    a warm socket instead of paying a full TCP and TLS handshake per call.
+    Transient connection failures are retried with an exponential backoff.
+
+    Returns:
+        A configured :py:class:`~requests.Session` object.
+    """
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=Retry(total=RETRY_TOTAL, backoff_factor=RETRY_BACKOFF_FACTOR),
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Connection": "keep-alive", "Accept-Encoding": "gzip"})
+    return session
+
+
+_shared_session: requests.Session | None = None
+_shared_session_lock = threading.Lock()
+
+_background_executor: ThreadPoolExecutor | None = None
+_background_executor_lock = threading.Lock()
+
+
+def _get_background_executor() -> ThreadPoolExecutor:
+    """Get the process-wide executor used for asynchronous client requests.
+
+    Returns:
+        The shared :py:class:`~concurrent.futures.ThreadPoolExecutor` object,
+        created on first use.
+    """
+    global _background_executor
+
+    if _background_executor is None:
+        with _background_executor_lock:
+            if _background_executor is None:
+                _background_executor = ThreadPoolExecutor(
+                    max_workers=MAX_PARALLEL_REQUESTS,
+                    thread_name_prefix="dioptra-client",
+                )
+
+    return _background_executor
+
+
+def _get_shared_session() -> requests.Session:
+    """Get the process-wide session shared by all clients.
+
+    Every client talks to the same Dioptra host, so a single shared connection
+    pool amortizes the TCP and TLS handshakes across all clients and threads in
+    the process instead of each client warming up its own sockets.
+
+    Returns:
+        The shared :py:class:`~requests.Session` object, created on first use.
+    """
+    global _shared_session
+
+    if _shared_session is None:
+        with _shared_session_lock:
+            if _shared_session is None:
+                _shared_session = _build_session()
+
+    return _shared_session
 
 
 class DioptraClient(object):
@@ -45,6 +127,8 @@ class DioptraClient(object):
             else f"{os.environ['DIOPTRA_RESTAPI_URI']}/api/{api_version}"
         )
         self._scheme, self._netloc, self._path, _, _, _ = urlparse(address)
+        self._session = _get_shared_session()
+        self._queue_name_cache: dict[str, tuple[float, dict[str, Any]]] = {}
 
     @property
     def experiment_endpoint(self) -> str:
@@ -125,7 +209,7 @@ class DioptraClient(object):
             for more information on Dioptra's REST api.
         """
         plugin_name_query: str = urljoin(self.task_plugin_custom_endpoint, name)
-        result = cast(dict[str, Any], requests.delete(plugin_name_query).json())
+        result = cast(dict[str, Any], self._session.delete(plugin_name_query).json())
         return result
 
     def get_experiment_by_id(self, id: int) -> dict[str, Any]:
@@ -151,7 +235,7 @@ class DioptraClient(object):
             for more information on Dioptra's REST api.
         """
         experiment_id_query: str = urljoin(self.experiment_endpoint, str(id))
-        return cast(dict[str, Any], requests.get(experiment_id_query).json())
+        return cast(dict[str, Any], self._session.get(experiment_id_query).json())
 
     def get_experiment_by_name(self, name: str) -> dict[str, Any]:
         """Gets an experiment by its unique name.
@@ -177,7 +261,28 @@ class DioptraClient(object):
             for more information on Dioptra's REST api.
         """
         experiment_name_query: str = urljoin(self.experiment_endpoint, "name", name)
-        return cast(dict[str, Any], requests.get(experiment_name_query).json())
+        return cast(dict[str, Any], self._session.get(experiment_name_query).json())
+
+    def get_experiments_by_id(self, ids: Iterable[int]) -> list[dict[str, Any]]:
+        """Gets multiple experiments by their unique identifiers.
+
+        The lookups are issued in parallel over the client's connection pool, so
+        the total latency is close to a single round trip instead of the sum of
+        one round trip per experiment.
+
+        Args:
+            ids: An iterable of integers identifying registered experiments.
+
+        Returns:
+            A list of the Dioptra REST api's responses, in the same order as
+            the provided identifiers.
+
+        Notes:
+            See https://pages.nist.gov/dioptra/user-guide/api-reference-restapi.html
+            for more information on Dioptra's REST api.
+        """
+        with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS) as executor:
+            return list(executor.map(self.get_experiment_by_id, ids))
 
     def get_job_by_id(self, id: str) -> dict[str, Any]:
         """Gets a job by its unique identifier.
@@ -210,7 +315,48 @@ class DioptraClient(object):
             for more information on Dioptra's REST api.
         """
         job_id_query: str = urljoin(self.job_endpoint, id)
-        return cast(dict[str, Any], requests.get(job_id_query).json())
+        return cast(dict[str, Any], self._session.get(job_id_query).json())
+
+    def get_jobs_by_id(self, ids: Iterable[str]) -> list[dict[str, Any]]:
+        """Gets multiple jobs by their unique identifiers.
+
+        The lookups are issued in parallel over the client's connection pool, so
+        the total latency is close to a single round trip instead of the sum of
+        one round trip per job.
+
+        Args:
+            ids: An iterable of strings specifying job UUIDs.
+
+        Returns:
+            A list of the Dioptra REST api's responses, in the same order as
+            the provided identifiers.
+
+        Notes:
+            See https://pages.nist.gov/dioptra/user-guide/api-reference-restapi.html
+            for more information on Dioptra's REST api.
+        """
+        with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS) as executor:
+            return list(executor.map(self.get_job_by_id, ids))
+
+    def get_job_by_id_async(self, id: str) -> Future[dict[str, Any]]:
+        """Gets a job by its unique identifier without blocking the caller.
+
+        The request is submitted to a shared background executor, so the caller
+        can continue doing other work and collect the response later, or submit
+        several lookups whose round trips overlap.
+
+        Args:
+            id: A string specifying a job's UUID.
+
+        Returns:
+            A :py:class:`~concurrent.futures.Future` that resolves to the
+            Dioptra REST api's response.
+
+        Notes:
+            See https://pages.nist.gov/dioptra/user-guide/api-reference-restapi.html
+            for more information on Dioptra's REST api.
+        """
+        return _get_background_executor().submit(self.get_job_by_id, id)
 
     def get_queue_by_id(self, id: int) -> dict[str, Any]:
         """Gets a queue by its unique identifier.
@@ -235,13 +381,39 @@ class DioptraClient(object):
             for more information on Dioptra's REST api.
         """
         queue_id_query: str = urljoin(self.queue_endpoint, str(id))
-        return cast(dict[str, Any], requests.get(queue_id_query).json())
+        return cast(dict[str, Any], self._session.get(queue_id_query).json())
+
+    def get_queue_by_id_async(self, id: int) -> Future[dict[str, Any]]:
+        """Gets a queue by its unique identifier without blocking the caller.
+
+        The request is submitted to a shared background executor, so the caller
+        can continue doing other work and collect the response later, or submit
+        several lookups whose round trips overlap.
+
+        Args:
+            id: An integer identifying a registered queue.
 
-    def get_queue_by_name(self, name: str) -> dict[str, Any]:
+        Returns:
+            A :py:class:`~concurrent.futures.Future` that resolves to the
+            Dioptra REST api's response.
+
+        Notes:
+            See https://pages.nist.gov/dioptra/user-guide/api-reference-restapi.html
+            for more information on Dioptra's REST api.
+        """
+        return _get_background_executor().submit(self.get_queue_by_id, id)
+
+    def get_queue_by_name(self, name: str, refresh: bool = False) -> dict[str, Any]:
         """Gets a queue by its unique name.
 
+        Responses are memoized for a short time so that repeated lookups of the
+        same queue skip the network entirely. The cache is invalidated when the
+        client registers, locks or unlocks a queue.
+
         Args:
             name: The name of the queue.
+            refresh: If True, bypass the memoized response and fetch a fresh
+                copy from the REST api. Defaults to False.
 
         Returns:
             The Dioptra REST api's response.
@@ -259,8 +431,40 @@ class DioptraClient(object):
             See https://pages.nist.gov/dioptra/user-guide/api-reference-restapi.html
             for more information on Dioptra's REST api.
         """
+        if not refresh:
+            cached = self._queue_name_cache.get(name)
+
+            if cached is not None:
+                timestamp, response = cached
+
+                if time.monotonic() - timestamp < QUEUE_CACHE_TTL_SECONDS:
+                    return response
+
         queue_name_query: str = urljoin(self.queue_endpoint, "name", name)
-        return cast(dict[str, Any], requests.get(queue_name_query).json())
+        response = cast(dict[str, Any], self._session.get(queue_name_query).json())
+        self._queue_name_cache[name] = (time.monotonic(), response)
+        return response
+
+    def get_queues_by_id(self, ids: Iterable[int]) -> list[dict[str, Any]]:
+        """Gets multiple queues by their unique identifiers.
+
+        The lookups are issued in parallel over the client's connection pool, so
+        the total latency is close to a single round trip instead of the sum of
+        one round trip per queue.
+
+        Args:
+            ids: An iterable of integers identifying registered queues.
+
+        Returns:
+            A list of the Dioptra REST api's responses, in the same order as
+            the provided identifiers.
+
+        Notes:
+            See https://pages.nist.gov/dioptra/user-guide/api-reference-restapi.html
+            for more information on Dioptra's REST api.
+        """
+        with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS) as executor:
+            return list(executor.map(self.get_queue_by_id, ids))
 
     def get_builtin_task_plugin(self, name: str) -> dict[str, Any]:
         """Gets a custom builtin plugin by its unique name.
@@ -285,7 +489,7 @@ class DioptraClient(object):
             for more information on Dioptra's REST api.
         """
         task_plugin_name_query: str = urljoin(self.task_plugin_builtins_endpoint, name)
-        return cast(dict[str, Any], requests.get(task_plugin_name_query).json())
+        return cast(dict[str, Any], self._session.get(task_plugin_name_query).json())
 
     def get_custom_task_plugin(self, name: str) -> dict[str, Any]:
         """Gets a custom task plugin by its unique name.
@@ -320,7 +524,7 @@ class DioptraClient(object):
             for more information on Dioptra's REST api.
         """
         task_plugin_name_query: str = urljoin(self.task_plugin_custom_endpoint, name)
-        return cast(dict[str, Any], requests.get(task_plugin_name_query).json())
+        return cast(dict[str, Any], self._session.get(task_plugin_name_query).json())
 
     def list_experiments(self) -> list[dict[str, Any]]:
         """Gets a list of all registered experiments.
@@ -350,7 +554,9 @@ class DioptraClient(object):
             See https://pages.nist.gov/dioptra/user-guide/api-reference-restapi.html
             for more information on Dioptra's REST api.
         """
-        return cast(list[dict[str, Any]], requests.get(self.experiment_endpoint).json())
+        return cast(
+            list[dict[str, Any]], self._session.get(self.experiment_endpoint).json()
+        )
 
     def list_jobs(self) -> list[dict[str, Any]]:
         """Gets a list of all submitted jobs.
@@ -382,7 +588,7 @@ class DioptraClient(object):
             See https://pages.nist.gov/dioptra/user-guide/api-reference-restapi.html
             for more information on Dioptra's REST api.
         """
-        return cast(list[dict[str, Any]], requests.get(self.job_endpoint).json())
+        return cast(list[dict[str, Any]], self._session.get(self.job_endpoint).json())
 
     def list_queues(self) -> list[dict[str, Any]]:
         """Gets a list of all registered queues.
@@ -423,7 +629,7 @@ class DioptraClient(object):
             See https://pages.nist.gov/dioptra/user-guide/api-reference-restapi.html
             for more information on Dioptra's REST api.
         """
-        return cast(list[dict[str, Any]], requests.get(self.queue_endpoint).json())
+        return cast(list[dict[str, Any]], self._session.get(self.queue_endpoint).json())
 
     def list_all_task_plugins(self) -> list[dict[str, Any]]:
         """Gets a list of all registered builtin task plugins.
@@ -453,7 +659,7 @@ class DioptraClient(object):
         """
 
         return cast(
-            list[dict[str, Any]], requests.get(self.task_plugin_endpoint).json()
+            list[dict[str, Any]], self._session.get(self.task_plugin_endpoint).json()
         )
 
     def list_builtin_task_plugins(self) -> list[dict[str, Any]]:
@@ -484,7 +690,7 @@ class DioptraClient(object):
         """
         return cast(
             list[dict[str, Any]],
-            requests.get(self.task_plugin_builtins_endpoint).json(),
+            self._session.get(self.task_plugin_builtins_endpoint).json(),
         )
 
     def list_custom_task_plugins(self) -> list[dict[str, Any]]:
@@ -514,7 +720,8 @@ class DioptraClient(object):
             for more information on Dioptra's REST api.
         """
         return cast(
-            list[dict[str, Any]], requests.get(self.task_plugin_custom_endpoint).json()
+            list[dict[str, Any]],
+            self._session.get(self.task_plugin_custom_endpoint).json(),
         )
 
     def lock_queue(self, name: str) -> dict[str, Any]:
@@ -534,8 +741,9 @@ class DioptraClient(object):
             See https://pages.nist.gov/dioptra/user-guide/api-reference-restapi.html
             for more information on Dioptra's REST api.
         """
+        self._queue_name_cache.pop(name, None)
         queue_name_query: str = urljoin(self.queue_endpoint, "name", name, "lock")
-        return cast(dict[str, Any], requests.put(queue_name_query).json())
+        return cast(dict[str, Any], self._session.put(queue_name_query).json())
 
     def unlock_queue(self, name: str) -> dict[str, Any]:
         """Removes the lock from the queue (name reference) if it exists.
@@ -554,8 +762,9 @@ class DioptraClient(object):
             See https://pages.nist.gov/dioptra/user-guide/api-reference-restapi.html
             for more information on Dioptra's REST api.
         """
+        self._queue_name_cache.pop(name, None)
         queue_name_query: str = urljoin(self.queue_endpoint, "name", name, "lock")
-        return cast(dict[str, Any], requests.delete(queue_name_query).json())
+        return cast(dict[str, Any], self._session.delete(queue_name_query).json())
 
     def register_experiment(self, name: str) -> dict[str, Any]:
         """Creates a new experiment via an experiment registration form.
@@ -581,7 +790,7 @@ class DioptraClient(object):
         """
         experiment_registration_form = {"name": name}
 
-        response = requests.post(
+        response = self._session.post(
             self.experiment_endpoint,
             json=experiment_registration_form,
         )
@@ -610,15 +819,37 @@ class DioptraClient(object):
             See https://pages.nist.gov/dioptra/user-guide/api-reference-restapi.html
             for more information on Dioptra's REST api.
         """
+        self._queue_name_cache.pop(name, None)
         queue_registration_form = {"name": name}
 
-        response = requests.post(
+        response = self._session.post(
             self.queue_endpoint,
             json=queue_registration_form,
         )
 
         return cast(dict[str, Any], response.json())
 
+    def register_queues(self, names: Iterable[str]) -> list[dict[str, Any]]:
+        """Creates multiple new queues via queue registration forms.
+
+        The registrations are issued in parallel over the client's connection
+        pool, which amortizes the per-request connection setup across the batch
+        and overlaps the independent round trips.
+
+        Args:
+            names: An iterable of names to register as new queues.
+
+        Returns:
+            A list of the Dioptra REST api's responses, in the same order as
+            the provided names.
+
+        Notes:
+            See https://pages.nist.gov/dioptra/user-guide/api-reference-restapi.html
+            for more information on Dioptra's REST api.
+        """
+        with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS) as executor:
+            return list(executor.map(self.register_queue, names))
+
     def submit_job(
         self,
         workflows_file: str | Path,
@@ -687,7 +918,7 @@ class DioptraClient(object):
 
         with workflows_file.open("rb") as f:
             job_files = {"workflow": (workflows_file.name, f)}
-            response = requests.post(
+            response = self._session.post(
                 self.job_endpoint,
                 data=job_form,
                 files=job_files,
@@ -737,7 +968,7 @@ class DioptraClient(object):
 
         with custom_plugin_file.open("rb") as f:
             custom_plugin_file_dict = {"taskPluginFile": (custom_plugin_file.name, f)}
-            response = requests.post(
+            response = self._session.post(
                 self.task_plugin_endpoint,
                 data=plugin_upload_form,
                 files=custom_plugin_file_dict,
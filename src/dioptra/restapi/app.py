@@ -22,12 +22,13 @@ dependencies.
 """
 from __future__ import annotations
 
+import gzip
+import itertools
 import os
-import uuid
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, Final, List, Optional
 
 import structlog
-from flask import Flask, jsonify
+from flask import Flask, jsonify, request
 from flask_cors import CORS
 from flask_login import LoginManager
 from flask_migrate import Migrate
@@ -46,6 +47,33 @@ cors: CORS = CORS()
 login_manager = LoginManager()
 migrate: Migrate = Migrate()
 
+_PROCESS_ID: Final[int] = os.getpid()
+_REQUEST_COUNTER = itertools.count()
+
+# Responses smaller than this are cheaper to send uncompressed.
+COMPRESS_MIN_SIZE: Final[int] = 500
+# Level 4 trades a slightly larger payload for much less CPU than the
+# gzip default of 9.
+COMPRESS_LEVEL: Final[int] = 4
+
+
+def _new_request_id() -> str:
+    """Get a request id for logging purposes.
+
+    The incoming X-Request-Id header is reused when a proxy or client already
+    assigned one; otherwise a process-unique id is generated from a monotonic
+    counter, which is much cheaper than drawing a UUID per request.
+
+    Returns:
+        A string identifying the current request.
+    """
+    request_id = request.headers.get("X-Request-Id")
+
+    if request_id is not None:
+        return request_id
+
+    return f"{_PROCESS_ID:x}-{next(_REQUEST_COUNTER):x}"
+
 
 def create_app(env: Optional[str] = None, injector: Optional[Injector] = None) -> Flask:
     """Creates and configures a fresh instance of the Dioptra REST API.
@@ -96,10 +124,43 @@ def create_app(env: Optional[str] = None, injector: Optional[Injector] = None) -
     with app.app_context():
         migrate.init_app(app, db, render_as_batch=True)
 
+    @app.before_request
+    def bind_request_contextvars() -> None:
+        """Bind the request id so every log line in the request carries it."""
+        structlog.contextvars.bind_contextvars(request_id=_new_request_id())
+
+    @app.teardown_request
+    def clear_request_contextvars(exception: BaseException | None = None) -> None:
+        """Clear the request-scoped log context after each request."""
+        structlog.contextvars.clear_contextvars()
+
+    @app.after_request
+    def compress_response(response):
+        """Gzip response bodies for clients that advertise gzip support."""
+        if (
+            response.direct_passthrough
+            or response.status_code < 200
+            or response.status_code >= 300
+            or "Content-Encoding" in response.headers
+            or response.content_length is None
+            or response.content_length < COMPRESS_MIN_SIZE
+            # quality() rather than "in": __contains__ ignores qvalues, so a
+            # client opting out with "gzip;q=0" would still match.
+            or request.accept_encodings.quality("gzip") <= 0
+        ):
+            return response
+
+        response.set_data(
+            gzip.compress(response.get_data(), compresslevel=COMPRESS_LEVEL)
+        )
+        response.headers["Content-Encoding"] = "gzip"
+        response.vary.add("Accept-Encoding")
+        return response
+
     @app.route("/health")
     def health():
         """An endpoint for monitoring if the REST API is responding to requests."""
-        log = LOGGER.new(request_id=str(uuid.uuid4()))  # noqa: F841
+        log = LOGGER.new()  # noqa: F841
         return jsonify("healthy")
 
     if not injector:
@@ -69,6 +69,9 @@ class BaseConfig(object):
     DIOPTRA_PLUGINS_BUCKET = os.getenv("DIOPTRA_PLUGINS_BUCKET", "plugins")
     DIOPTRA_SWAGGER_PATH = os.getenv("DIOPTRA_SWAGGER_PATH", "/")
     DIOPTRA_BASE_URL = os.getenv("DIOPTRA_BASE_URL")
+    # Serialize responses without the whitespace flask-restx inserts by
+    # default, shrinking response bodies and the work done per request.
+    RESTX_JSON = {"separators": (",", ":")}
 
 
 class DevelopmentConfig(BaseConfig):
@@ -17,7 +17,6 @@
 """The module defining the endpoints for Artifact resources."""
 from __future__ import annotations
 
-import uuid
 from typing import cast
 from urllib.parse import unquote
 
@@ -74,9 +73,7 @@ class ArtifactEndpoint(Resource):
     @responds(schema=ArtifactPageSchema, api=api)
     def get(self):
         """Gets a list of all Artifact resources."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Artifact", request_type="GET"
-        )
+        log = LOGGER.new(resource="Artifact", request_type="GET")
         parsed_query_params = request.parsed_query_params  # noqa: F841
 
         group_id = parsed_query_params["group_id"]
@@ -108,9 +105,7 @@ class ArtifactEndpoint(Resource):
     @responds(schema=ArtifactSchema, api=api)
     def post(self):
         """Creates an Artifact resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Artifact", request_type="POST"
-        )
+        log = LOGGER.new(resource="Artifact", request_type="POST")
         log.debug("Request received")
         parsed_obj = request.parsed_obj  # noqa: F841
 
@@ -143,9 +138,7 @@ class ArtifactIdEndpoint(Resource):
     @responds(schema=ArtifactSchema, api=api)
     def get(self, id: int):
         """Gets an Artifact resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Artifact", request_type="GET", id=id
-        )
+        log = LOGGER.new(resource="Artifact", request_type="GET", id=id)
         artifact = cast(
             models.Artifact,
             self._artifact_id_service.get(id, error_if_not_found=True, log=log),
@@ -157,9 +150,7 @@ class ArtifactIdEndpoint(Resource):
     @responds(schema=ArtifactSchema, api=api)
     def put(self, id: int):
         """Modifies an Artifact resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Artifact", request_type="PUT", id=id
-        )
+        log = LOGGER.new(resource="Artifact", request_type="PUT", id=id)
         parsed_obj = request.parsed_obj  # type: ignore
         artifact = cast(
             models.Artifact,
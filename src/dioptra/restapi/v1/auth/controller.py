@@ -17,7 +17,6 @@
 """The module defining the auth endpoints."""
 from __future__ import annotations
 
-import uuid
 from typing import Any
 
 import structlog
@@ -56,9 +55,7 @@ class LoginResource(Resource):
     @responds(schema=LoginSchema, api=api)
     def post(self) -> dict[str, Any]:
         """Login to a registered user account."""
-        log: BoundLogger = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="auth/login", request_type="POST"
-        )
+        log: BoundLogger = LOGGER.new(resource="auth/login", request_type="POST")
         parsed_obj = request.parsed_obj  # type: ignore
         return self._auth_service.login(
             username=parsed_obj["username"], password=parsed_obj["password"], log=log
@@ -89,9 +86,7 @@ class LogoutResource(Resource):
 
         Must be logged in.
         """
-        log: BoundLogger = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="auth/logout", request_type="POST"
-        )
+        log: BoundLogger = LOGGER.new(resource="auth/logout", request_type="POST")
         parsed_query_params = request.parsed_query_params  # type: ignore
         return self._auth_service.logout(
             everywhere=parsed_query_params["everywhere"], log=log
@@ -17,7 +17,6 @@
 """The module defining the endpoints for Entrypoint resources."""
 from __future__ import annotations
 
-import uuid
 from typing import cast
 
 import structlog
@@ -91,9 +90,7 @@ class EntrypointEndpoint(Resource):
     @responds(schema=EntrypointPageSchema, api=api)
     def get(self):
         """Gets a list of Entrypoint resources matching the filter parameters."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Entrypoint", request_type="GET"
-        )
+        log = LOGGER.new(resource="Entrypoint", request_type="GET")
 
         parsed_query_params = request.parsed_query_params  # noqa: F841
         group_id = parsed_query_params["group_id"]
@@ -125,9 +122,7 @@ class EntrypointEndpoint(Resource):
     @responds(schema=EntrypointSchema, api=api)
     def post(self):
         """Creates an Entrypoint resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Entrypoint", request_type="POST"
-        )
+        log = LOGGER.new(resource="Entrypoint", request_type="POST")
         parsed_obj = request.parsed_obj  # noqa: F841
         entrypoint = self._entrypoint_service.create(
             name=parsed_obj["name"],
@@ -164,7 +159,6 @@ class EntrypointIdEndpoint(Resource):
     def get(self, id: int):
         """Gets an Entrypoint resource by its unique ID."""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="Entrypoint",
             request_type="GET",
             id=id,
@@ -181,7 +175,6 @@ class EntrypointIdEndpoint(Resource):
     def put(self, id: int):
         """Modifies an Entrypoint resource by its unique ID."""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="Entrypoint",
             request_type="PUT",
             id=id,
@@ -207,7 +200,6 @@ class EntrypointIdEndpoint(Resource):
     def delete(self, id: int):
         """Deletes an Entrypoint resource by its unique ID."""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="Entrypoint",
             request_type="DELETE",
             id=id,
@@ -236,9 +228,7 @@ class EntrypointIdPluginsEndpoint(Resource):
     @responds(schema=EntrypointPluginSchema(many=True), api=api)
     def get(self, id: int):
         """Retrieves the plugin snapshots for an entrypoint resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Entrypoint", request_type="POST"
-        )
+        log = LOGGER.new(resource="Entrypoint", request_type="POST")
         plugins = self._entrypoint_id_plugins_service.get(id, log=log)
         return [utils.build_entrypoint_plugin(plugin) for plugin in plugins]
 
@@ -247,9 +237,7 @@ class EntrypointIdPluginsEndpoint(Resource):
     @responds(schema=EntrypointPluginSchema(many=True), api=api)
     def post(self, id: int):
         """Appends plugins to an entrypoint resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Entrypoint", request_type="POST"
-        )
+        log = LOGGER.new(resource="Entrypoint", request_type="POST")
         parsed_obj = request.parsed_obj  # type: ignore
         plugins = self._entrypoint_id_plugins_service.append(
             id, plugin_ids=parsed_obj["plugin_ids"], log=log
@@ -282,9 +270,7 @@ class EntrypointIdPluginsIdEndpoint(Resource):
     @responds(schema=EntrypointPluginSchema, api=api)
     def get(self, id: int, pluginId: int):
         """Retrieves a plugin snapshot for an entrypoint resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Entrypoint", request_type="POST"
-        )
+        log = LOGGER.new(resource="Entrypoint", request_type="POST")
         plugin = self._entrypoint_id_plugins_id_service.get(id, pluginId, log=log)
         return utils.build_entrypoint_plugin(plugin)
 
@@ -293,7 +279,6 @@ class EntrypointIdPluginsIdEndpoint(Resource):
     def delete(self, id: int, pluginId: int):
         """Removes a plugin from an entrypoint by ID."""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="Entrypoint",
             request_type="DELETE",
             id=id,
@@ -315,9 +300,7 @@ class EntrypointIdQueuesEndpoint(Resource):
     @responds(schema=QueueRefSchema(many=True), api=api)
     def get(self, id: int):
         """Gets the list of Queues for the resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Entrypoint", request_type="GET"
-        )
+        log = LOGGER.new(resource="Entrypoint", request_type="GET")
         queues = self._entrypoint_id_queues_service.get(id, log=log)
         return [utils.build_queue_ref(queue) for queue in queues]
 
@@ -326,9 +309,7 @@ class EntrypointIdQueuesEndpoint(Resource):
     @responds(schema=QueueRefSchema(many=True), api=api)
     def post(self, id: int):
         """Appends one or more Queues to the resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Entrypoint", request_type="POST"
-        )
+        log = LOGGER.new(resource="Entrypoint", request_type="POST")
         parsed_obj = request.parsed_obj  # type: ignore
         queues = cast(
             list[models.Queue],
@@ -343,9 +324,7 @@ class EntrypointIdQueuesEndpoint(Resource):
     @responds(schema=QueueRefSchema(many=True), api=api)
     def put(self, id: int):
         """Replaces one or more Queues to the resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Entrypoint", request_type="POST"
-        )
+        log = LOGGER.new(resource="Entrypoint", request_type="POST")
         parsed_obj = request.parsed_obj  # type: ignore
         queues = self._entrypoint_id_queues_service.modify(
             id, queue_ids=parsed_obj["ids"], error_if_not_found=True, log=log
@@ -356,9 +335,7 @@ class EntrypointIdQueuesEndpoint(Resource):
     @responds(schema=IdStatusResponseSchema, api=api)
     def delete(self, id: int):
         """Removes all Queues from the resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Entrypoint", request_type="DELETE"
-        )
+        log = LOGGER.new(resource="Entrypoint", request_type="DELETE")
         return self._entrypoint_id_queues_service.delete(
             id, error_if_not_found=True, log=log
         )
@@ -382,9 +359,7 @@ class EntrypointIdQueuesId(Resource):
     @responds(schema=IdStatusResponseSchema, api=api)
     def delete(self, id: int, queueId):
         """Removes a Queue from the Entrypoint resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Entrypoint", request_type="GET"
-        )
+        log = LOGGER.new(resource="Entrypoint", request_type="GET")
         return self._entrypoint_id_queues_id_service.delete(id, queueId, log=log)
 
 
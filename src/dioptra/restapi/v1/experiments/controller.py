@@ -15,7 +15,6 @@
 # ACCESS THE FULL CC BY 4.0 LICENSE HERE:
 # https://creativecommons.org/licenses/by/4.0/legalcode
 """The module defining the endpoints for Experiment resources."""
-import uuid
 from typing import cast
 from urllib.parse import unquote
 
@@ -102,7 +101,6 @@ class ExperimentEndpoint(Resource):
     def get(self):
         """Gets a page of Experiment resources matching the filter parameters."""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="ExperimentEndpoint",
             request_type="GET",
         )
@@ -138,7 +136,6 @@ class ExperimentEndpoint(Resource):
     def post(self):
         """Creates an Experiment resource with a provided name."""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="ExperimentEndpoint",
             request_type="POST",
         )
@@ -175,7 +172,6 @@ class ExperimentIdEndpoint(Resource):
     def get(self, id: int):
         """Gets an experiment by its unique identifier."""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="Experiment",
             request_type="GET",
             id=id,
@@ -191,7 +187,6 @@ class ExperimentIdEndpoint(Resource):
     def delete(self, id: int):
         """Deletes an experiment by its unique identifier."""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="Experiment",
             request_type="DELETE",
             id=id,
@@ -204,7 +199,6 @@ class ExperimentIdEndpoint(Resource):
     def put(self, id: int):
         """Modifies an experiment by its unique identifier."""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="Experiment",
             request_type="PUT",
             id=id,
@@ -250,7 +244,6 @@ class ExperimentIdJobEndpoint(Resource):
     def get(self, id: int):
         """Returns a list of jobs for a specified Experiment."""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="ExperimentIdJobEndpoint",
             request_type="GET",
             id=id,
@@ -286,7 +279,6 @@ class ExperimentIdJobEndpoint(Resource):
     def post(self, id: int):
         """Creates a Job resource under the specified Experiment."""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="ExperimentIdJobEndpoint",
             request_type="POST",
         )
@@ -327,7 +319,6 @@ class ExperimentIdJobIdEndpoint(Resource):
     def get(self, id: int, jobId: int):
         """Gets a Job resource."""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="ExperimentIdJobIdEndpoint",
             request_type="GET",
             id=id,
@@ -341,7 +332,6 @@ class ExperimentIdJobIdEndpoint(Resource):
     def delete(self, id: int, jobId: int):
         """Deletes a Job resource."""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="ExperimentIdJobIdEndpoint",
             request_type="DELETE",
             id=id,
@@ -376,7 +366,6 @@ class ExperimentIdJobIdStatusEndpoint(Resource):
     def get(self, id: int, jobId: int):
         """Gets a Job resource's status."""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="ExperimentIdJobIdStatusEndpoint",
             request_type="GET",
             experiment_id=id,
@@ -392,7 +381,6 @@ class ExperimentIdJobIdStatusEndpoint(Resource):
     def put(self, id: int, jobId: int):
         """Modifies a Job resource's status."""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="ExperimentIdJobIdStatusEndpoint",
             request_type="PUT",
             experiment_id=id,
@@ -434,7 +422,6 @@ class ExperimentIdJobIdMlflowrunEndpoint(Resource):
     def get(self, id: int, jobId: int):
         """Gets a Job resource's mlflow run id."""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="ExperimentIdJobIdMlflowrunEndpoint",
             request_type="GET",
             experiment_id=id,
@@ -450,7 +437,6 @@ class ExperimentIdJobIdMlflowrunEndpoint(Resource):
     def post(self, id: int, jobId: int):
         """Sets the mlflow run id for a Job"""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="ExperimentIdJobIdMlflowrunEndpoint",
             request_type="POST",
             experiment_id=id,
@@ -493,9 +479,7 @@ class ExperimentIdJobIdArtifactsEndpoint(Resource):
     @responds(schema=ArtifactSchema, api=api)
     def post(self, id: int, jobId: int):
         """Creates an Artifact resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Artifact", request_type="POST"
-        )
+        log = LOGGER.new(resource="Artifact", request_type="POST")
         log.debug("Request received")
         parsed_obj = request.parsed_obj  # type: ignore
 
@@ -533,9 +517,7 @@ class ExperimentIdEntrypointsEndpoint(Resource):
     @responds(schema=EntrypointRefSchema(many=True), api=api)
     def get(self, id: int):
         """Gets the list of Entrypoints for the resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Experiment", request_type="GET"
-        )
+        log = LOGGER.new(resource="Experiment", request_type="GET")
         entrypoints = self._experiment_id_entrypoints.get(id, log=log)
         return [utils.build_entrypoint_ref(entrypoint) for entrypoint in entrypoints]
 
@@ -544,9 +526,7 @@ class ExperimentIdEntrypointsEndpoint(Resource):
     @responds(schema=EntrypointRefSchema(many=True), api=api)
     def post(self, id: int):
         """Appends one or more Entrypoints to the resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Experiment", request_type="POST"
-        )
+        log = LOGGER.new(resource="Experiment", request_type="POST")
         parsed_obj = request.parsed_obj  # type: ignore
         entrypoints = cast(
             list[models.EntryPoint],
@@ -561,9 +541,7 @@ class ExperimentIdEntrypointsEndpoint(Resource):
     @responds(schema=EntrypointRefSchema(many=True), api=api)
     def put(self, id: int):
         """Replaces one or more Entrypoints to the resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Experiment", request_type="POST"
-        )
+        log = LOGGER.new(resource="Experiment", request_type="POST")
         parsed_obj = request.parsed_obj  # type: ignore
         entrypoints = self._experiment_id_entrypoints.modify(
             id, entrypoint_ids=parsed_obj["ids"], error_if_not_found=True, log=log
@@ -574,9 +552,7 @@ class ExperimentIdEntrypointsEndpoint(Resource):
     @responds(schema=IdStatusResponseSchema, api=api)
     def delete(self, id: int):
         """Removes all Entrypoints from the resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Experiment", request_type="DELETE"
-        )
+        log = LOGGER.new(resource="Experiment", request_type="DELETE")
         return self._experiment_id_entrypoints.delete(
             id, error_if_not_found=True, log=log
         )
@@ -610,9 +586,7 @@ class ExperimentIdEntrypointsId(Resource):
     @responds(schema=IdStatusResponseSchema, api=api)
     def delete(self, id: int, entrypointId):
         """Removes a Entrypoint from the Experiment resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Experiment", request_type="GET"
-        )
+        log = LOGGER.new(resource="Experiment", request_type="GET")
         return self._experiments_id_entrypoints_id_service.delete(
             id, entrypointId, log=log
         )
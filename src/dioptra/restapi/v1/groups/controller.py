@@ -15,7 +15,6 @@
 # ACCESS THE FULL CC BY 4.0 LICENSE HERE:
 # https://creativecommons.org/licenses/by/4.0/legalcode
 """The module defining the endpoints for Group resources."""
-import uuid
 from typing import cast
 from urllib.parse import unquote
 
@@ -65,9 +64,7 @@ class GroupEndpoint(Resource):
     @responds(schema=GroupPageSchema, api=api)
     def get(self):
         """Gets a list of all Group resources."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Group", request_type="GET"
-        )
+        log = LOGGER.new(resource="Group", request_type="GET")
         parsed_query_params = request.parsed_query_params  # noqa: F841
 
         search_string = unquote(parsed_query_params["search"])
@@ -97,9 +94,7 @@ class GroupEndpoint(Resource):
     @responds(schema=GroupSchema, api=api)
     def _post(self):
         """Creates a Group resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Group", request_type="POST"
-        )
+        log = LOGGER.new(resource="Group", request_type="POST")
         parsed_obj = request.parsed_obj  # noqa: F841
 
         group = self._group_service.create(name=parsed_obj["name"], log=log)
@@ -125,9 +120,7 @@ class GroupIdEndpoint(Resource):
     @responds(schema=GroupSchema, api=api)
     def get(self, id: int):
         """Gets a Group resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Group", request_type="GET", id=id
-        )
+        log = LOGGER.new(resource="Group", request_type="GET", id=id)
         group = cast(
             models.Group,
             self._group_id_service.get(id, error_if_not_found=True, log=log),
@@ -138,9 +131,7 @@ class GroupIdEndpoint(Resource):
     @responds(schema=IdStatusResponseSchema, api=api)
     def _delete(self, id: int):
         """Deletes a Group resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Group", request_type="DELETE", id=id
-        )
+        log = LOGGER.new(resource="Group", request_type="DELETE", id=id)
         return self._group_id_service.delete(id, log=log)
 
     @login_required
@@ -148,9 +139,7 @@ class GroupIdEndpoint(Resource):
     @responds(schema=GroupSchema, api=api)
     def _put(self, id: int):
         """Modifies a Group resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Group", request_type="PUT", id=id
-        )
+        log = LOGGER.new(resource="Group", request_type="PUT", id=id)
         parsed_obj = request.parsed_obj  # type: ignore # noqa: F841
         group = cast(
             models.Group,
@@ -169,7 +158,6 @@ class GroupIdMembersEndpoint(Resource):
     def get(self, id: int):
         """Gets a list of Member's Group Permissions."""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="GroupMember",
             request_type="GET",
             id=id,
@@ -182,7 +170,6 @@ class GroupIdMembersEndpoint(Resource):
     def post(self, id: int):
         """Adds a Member to the Group with default permissions."""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="GroupMember",
             request_type="POST",
             id=id,
@@ -196,7 +183,6 @@ class GroupIdMembersEndpoint(Resource):
     def put(self, id: int):
         """Modifies all Group Members' permisssions."""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="GroupMember",
             request_type="POST",
             id=id,
@@ -214,7 +200,6 @@ class GroupIdMembersUserIdEndpoint(Resource):
     def get(self, id: int, user_id: int):
         """Gets a Member's Group permissions."""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="GroupMember",
             request_type="GET",
             id=id,
@@ -226,7 +211,6 @@ class GroupIdMembersUserIdEndpoint(Resource):
     def delete(self, id: int, user_id: int):
         """Removes a Member from the Group."""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="GroupMember",
             request_type="DELETE",
             id=id,
@@ -239,7 +223,6 @@ class GroupIdMembersUserIdEndpoint(Resource):
     def patch(self, id: int, user_id: int):
         """Modifies a Member's Group permissions."""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="GroupMember",
             request_type="PATCH",
             id=id,
@@ -17,7 +17,6 @@
 """The module defining the endpoints for Plugin resources."""
 from __future__ import annotations
 
-import uuid
 from typing import cast
 from urllib.parse import unquote
 
@@ -82,9 +81,7 @@ class JobEndpoint(Resource):
     @responds(schema=JobPageSchema, api=api)
     def get(self):
         """Gets a list of all Job resources."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Job", request_type="GET"
-        )
+        log = LOGGER.new(resource="Job", request_type="GET")
         log.debug("Request received")
         parsed_query_params = request.parsed_query_params  # noqa: F841
 
@@ -132,9 +129,7 @@ class JobIdEndpoint(Resource):
     @responds(schema=JobSchema, api=api)
     def get(self, id: int):
         """Gets a Job resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Job", request_type="GET", id=id
-        )
+        log = LOGGER.new(resource="Job", request_type="GET", id=id)
         job = cast(
             models.Job,
             self._job_id_service.get(id, error_if_not_found=True, log=log),
@@ -145,9 +140,7 @@ class JobIdEndpoint(Resource):
     @responds(schema=IdStatusResponseSchema, api=api)
     def delete(self, id: int):
         """Deletes a Job resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Job", request_type="DELETE", id=id
-        )
+        log = LOGGER.new(resource="Job", request_type="DELETE", id=id)
         return self._job_id_service.delete(job_id=id, log=log)
 
 
@@ -172,9 +165,7 @@ class JobIdStatusEndpoint(Resource):
     @responds(schema=JobStatusSchema, api=api)
     def get(self, id: int):
         """Gets a Job resource's status."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Job", request_type="GET", id=id
-        )
+        log = LOGGER.new(resource="Job", request_type="GET", id=id)
         return self._job_id_status_service.get(
             job_id=id, error_if_not_found=True, log=log
         )
@@ -205,7 +196,6 @@ class JobIdMlflowrunEndpoint(Resource):
     def get(self, id: int):
         """Gets a Job resource's mlflow run id."""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="JobIdMlflowrunEndpoint",
             request_type="GET",
             job_id=id,
@@ -220,7 +210,6 @@ class JobIdMlflowrunEndpoint(Resource):
     def post(self, id: int):
         """Sets the mlflow run id for a Job"""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="JobIdMlflowrunEndpoint",
             request_type="POST",
             job_id=id,
@@ -17,7 +17,6 @@
 """The module defining the endpoints for Model resources."""
 from __future__ import annotations
 
-import uuid
 from typing import cast
 from urllib.parse import unquote
 
@@ -90,9 +89,7 @@ class ModelEndpoint(Resource):
     @responds(schema=ModelPageSchema, api=api)
     def get(self):
         """Gets a list of all Model resources."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Models", request_type="GET"
-        )
+        log = LOGGER.new(resource="Models", request_type="GET")
 
         parsed_query_params = request.parsed_query_params  # noqa: F841
         group_id = parsed_query_params["group_id"]
@@ -124,9 +121,7 @@ class ModelEndpoint(Resource):
     @responds(schema=ModelSchema, api=api)
     def post(self):
         """Creates a Model resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Model", request_type="POST"
-        )
+        log = LOGGER.new(resource="Model", request_type="POST")
         parsed_obj = request.parsed_obj  # noqa: F841
         model = self._model_service.create(
             name=parsed_obj["name"],
@@ -156,9 +151,7 @@ class ModelIdEndpoint(Resource):
     @responds(schema=ModelSchema, api=api)
     def get(self, id: int):
         """Gets a Model resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Model", request_type="GET", id=id
-        )
+        log = LOGGER.new(resource="Model", request_type="GET", id=id)
         model = cast(
             models.MlModel,
             self._model_id_service.get(id, error_if_not_found=True, log=log),
@@ -169,9 +162,7 @@ class ModelIdEndpoint(Resource):
     @responds(schema=IdStatusResponseSchema, api=api)
     def delete(self, id: int):
         """Deletes a Model resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Model", request_type="DELETE", id=id
-        )
+        log = LOGGER.new(resource="Model", request_type="DELETE", id=id)
         return self._model_id_service.delete(model_id=id, log=log)
 
     @login_required
@@ -179,9 +170,7 @@ class ModelIdEndpoint(Resource):
     @responds(schema=ModelSchema, api=api)
     def put(self, id: int):
         """Modifies a Model resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Model", request_type="PUT", id=id
-        )
+        log = LOGGER.new(resource="Model", request_type="PUT", id=id)
         parsed_obj = request.parsed_obj  # type: ignore # noqa: F841
         model = cast(
             models.MlModel,
@@ -218,9 +207,7 @@ class ModelIdVersionsEndpoint(Resource):
     @responds(schema=ModelVersionPageSchema, api=api)
     def get(self, id: int):
         """Gets a list of versions of this Model resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Model", request_type="GET"
-        )
+        log = LOGGER.new(resource="Model", request_type="GET")
 
         parsed_query_params = request.parsed_query_params  # type: ignore
         search_string = unquote(parsed_query_params["search"])
@@ -255,9 +242,7 @@ class ModelIdVersionsEndpoint(Resource):
     @responds(schema=ModelVersionSchema, api=api)
     def post(self, id: int):
         """Creates a new version of the model resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Model", request_type="POST"
-        )
+        log = LOGGER.new(resource="Model", request_type="POST")
         parsed_obj = request.parsed_obj  # type: ignore
         model = self._model_id_versions_service.create(
             id,
@@ -293,9 +278,7 @@ class ModelIdVersionsNumberEndpoint(Resource):
     @responds(schema=ModelVersionSchema, api=api)
     def get(self, id: int, versionNumber: int):
         """Gets a specific version of a model by version number."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Models", request_type="GET"
-        )
+        log = LOGGER.new(resource="Models", request_type="GET")
         model = cast(
             utils.ModelWithVersionDict,
             self._model_id_versions_number_service.get(
@@ -309,9 +292,7 @@ class ModelIdVersionsNumberEndpoint(Resource):
     @responds(schema=ModelVersionSchema, api=api)
     def put(self, id: int, versionNumber: int):
         """Modifies specific version of the model resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Model", request_type="POST"
-        )
+        log = LOGGER.new(resource="Model", request_type="POST")
         parsed_obj = request.parsed_obj  # type: ignore
         model = cast(
             utils.ModelWithVersionDict,
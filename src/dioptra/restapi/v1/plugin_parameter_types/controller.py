@@ -15,7 +15,6 @@
 # ACCESS THE FULL CC BY 4.0 LICENSE HERE:
 # https://creativecommons.org/licenses/by/4.0/legalcode
 """The module defining the endpoints for PluginParameterType resources."""
-import uuid
 from typing import cast
 
 import structlog
@@ -86,7 +85,6 @@ class PluginParameterTypeEndpoint(Resource):
     def get(self):
         """Gets a list of all PluginParameterType resources."""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="PluginParameterType",
             request_type="GET",
         )
@@ -125,7 +123,6 @@ class PluginParameterTypeEndpoint(Resource):
     def post(self):
         """Creates a PluginParameterType resource."""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="PluginParameterType",
             request_type="POST",
         )
@@ -166,7 +163,6 @@ class PluginParameterTypeIdEndpoint(Resource):
     def get(self, id: int):
         """Gets a PluginParameterType resource."""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="PluginParameterType",
             request_type="GET",
             id=id,
@@ -184,7 +180,6 @@ class PluginParameterTypeIdEndpoint(Resource):
     def delete(self, id: int):
         """Deletes a PluginParameterType resource."""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="PluginParameterType",
             request_type="DELETE",
             id=id,
@@ -199,7 +194,6 @@ class PluginParameterTypeIdEndpoint(Resource):
     def put(self, id: int):
         """Modifies a PluginParameterType resource."""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="PluginParameterType",
             request_type="PUT",
             id=id,
@@ -15,7 +15,6 @@
 # ACCESS THE FULL CC BY 4.0 LICENSE HERE:
 # https://creativecommons.org/licenses/by/4.0/legalcode
 """The module defining the endpoints for Plugin resources."""
-import uuid
 from typing import cast
 
 import structlog
@@ -118,9 +117,7 @@ class PluginEndpoint(Resource):
     @responds(schema=PluginPageSchema, api=api)
     def get(self):
         """Gets a list of all Plugin resources."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Plugin", request_type="GET"
-        )
+        log = LOGGER.new(resource="Plugin", request_type="GET")
         parsed_query_params = request.parsed_query_params  # noqa: F841
 
         group_id = parsed_query_params["group_id"]
@@ -152,9 +149,7 @@ class PluginEndpoint(Resource):
     @responds(schema=PluginSchema, api=api)
     def post(self):
         """Creates a Plugin resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Plugin", request_type="POST"
-        )
+        log = LOGGER.new(resource="Plugin", request_type="POST")
         parsed_obj = request.parsed_obj  # noqa: F841
 
         plugin = self._plugin_service.create(
@@ -185,9 +180,7 @@ class PluginIdEndpoint(Resource):
     @responds(schema=PluginSchema, api=api)
     def get(self, id: int):
         """Gets a Plugin resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Plugin", request_type="GET", id=id
-        )
+        log = LOGGER.new(resource="Plugin", request_type="GET", id=id)
         plugin = cast(
             models.Plugin,
             self._plugin_id_service.get(id, error_if_not_found=True, log=log),
@@ -199,7 +192,6 @@ class PluginIdEndpoint(Resource):
     def delete(self, id: int):
         """Deletes a Plugin resource."""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="Plugin",
             request_type="DELETE",
             id=id,
@@ -211,9 +203,7 @@ class PluginIdEndpoint(Resource):
     @responds(schema=PluginSchema, api=api)
     def put(self, id: int):
         """Modifies a Plugin resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Plugin", request_type="PUT", id=id
-        )
+        log = LOGGER.new(resource="Plugin", request_type="PUT", id=id)
         parsed_obj = request.parsed_obj  # type: ignore # noqa: F841
         plugin = cast(
             models.Plugin,
@@ -251,7 +241,6 @@ class PluginIdFilesEndpoint(Resource):
     def get(self, id: int):
         """Gets a list of all PluginFile resources for a Plugin resource."""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="PluginFile",
             request_type="GET",
             id=id,
@@ -287,7 +276,6 @@ class PluginIdFilesEndpoint(Resource):
     def delete(self, id: int):
         """Deletes all PluginFile resources associated with a Plugin resource."""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="PluginFile",
             request_type="DELETE",
             id=id,
@@ -299,9 +287,7 @@ class PluginIdFilesEndpoint(Resource):
     @responds(schema=PluginFileSchema, api=api)
     def post(self, id: int):
         """Creates a PluginFile resource associated with a Plugin resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="PluginFile", request_type="POST"
-        )
+        log = LOGGER.new(resource="PluginFile", request_type="POST")
         parsed_obj = request.parsed_obj  # type: ignore # noqa: F841
 
         plugin_file = self._plugin_id_file_service.create(
@@ -338,7 +324,6 @@ class PluginIdFileIdEndpoint(Resource):
     def get(self, id: int, fileId: int):
         """Gets a PluginFile resource."""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="PluginFile",
             request_type="GET",
             id=id,
@@ -356,7 +341,6 @@ class PluginIdFileIdEndpoint(Resource):
     def delete(self, id: int, fileId: int):
         """Deletes a PluginFile resource."""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="PluginFile",
             request_type="DELETE",
             id=id,
@@ -369,7 +353,6 @@ class PluginIdFileIdEndpoint(Resource):
     def put(self, id: int, fileId: int):
         """Modifies a PluginFile resource."""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="PluginFile",
             request_type="PUT",
             id=id,
@@ -15,17 +15,15 @@
 # ACCESS THE FULL CC BY 4.0 LICENSE HERE:
 # https://creativecommons.org/licenses/by/4.0/legalcode
 """The module defining the endpoints for Queue resources."""
-import uuid
-from typing import cast
-from urllib.parse import unquote
-
 import structlog
-from flask import request
+from flask import Response, after_this_request, request
 from flask_accepts import accepts, responds
 from flask_login import login_required
 from flask_restx import Namespace, Resource
 from injector import inject
+from marshmallow import EXCLUDE
 from structlog.stdlib import BoundLogger
+from werkzeug.http import quote_etag
 
 from dioptra.restapi.db import models
 from dioptra.restapi.routes import V1_QUEUES_ROUTE
@@ -53,13 +51,31 @@ from .schema import (
 )
 from .service import RESOURCE_TYPE, SEARCHABLE_FIELDS, QueueIdService, QueueService
 
+# The request id is bound into structlog's contextvars by the application's
+# before_request hook, so handlers only add the request-specific fields here.
 LOGGER: BoundLogger = structlog.stdlib.get_logger()
+QUEUE_LOG: BoundLogger = LOGGER.bind(resource="Queue")
 
 api: Namespace = Namespace("Queues", description="Queues endpoint")
 
+# Schema instances shared by the route decorators below. flask_accepts would
+# otherwise construct a fresh schema for each decorated method; a single
+# instance per schema is built here instead. The query parameters schema uses
+# unknown=EXCLUDE to match how flask_accepts instantiates query params schemas.
+_QUEUE_SCHEMA = QueueSchema()
+_QUEUE_PAGE_SCHEMA = QueuePageSchema()
+_QUEUE_MUTABLE_FIELDS_SCHEMA = QueueMutableFieldsSchema()
+_QUEUE_GET_QUERY_PARAMETERS = QueueGetQueryParameters(unknown=EXCLUDE)
+_ID_STATUS_RESPONSE_SCHEMA = IdStatusResponseSchema()
+
 
 @api.route("/")
 class QueueEndpoint(Resource):
+    # The resource holds no per-request state, so it is instantiated once at
+    # startup and reused for every request instead of re-running dependency
+    # injection per request.
+    init_every_request = False
+
     @inject
     def __init__(self, queue_service: QueueService, *args, **kwargs) -> None:
         """Initialize the queue resource.
@@ -73,19 +89,17 @@ class QueueEndpoint(Resource):
         super().__init__(*args, **kwargs)
 
     @login_required
-    @accepts(query_params_schema=QueueGetQueryParameters, api=api)
-    @responds(schema=QueuePageSchema, api=api)
+    @accepts(query_params_schema=_QUEUE_GET_QUERY_PARAMETERS, api=api)
+    @responds(schema=_QUEUE_PAGE_SCHEMA, api=api)
     def get(self):
         """Gets a list of all Queue resources."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Queue", request_type="GET"
-        )
+        log = QUEUE_LOG.bind(request_type="GET")
         parsed_query_params = request.parsed_query_params  # noqa: F841
 
-        group_id = parsed_query_params["group_id"]
-        search_string = unquote(parsed_query_params["search"])
-        page_index = parsed_query_params["index"]
-        page_length = parsed_query_params["page_length"]
+        group_id = parsed_query_params.group_id
+        search_string = parsed_query_params.search
+        page_index = parsed_query_params.index
+        page_length = parsed_query_params.page_length
 
         queues, total_num_queues = self._queue_service.get(
             group_id=group_id,
@@ -107,13 +121,11 @@ class QueueEndpoint(Resource):
         )
 
     @login_required
-    @accepts(schema=QueueSchema, api=api)
-    @responds(schema=QueueSchema, api=api)
+    @accepts(schema=_QUEUE_SCHEMA, api=api)
+    @responds(schema=_QUEUE_SCHEMA, api=api)
     def post(self):
         """Creates a Queue resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Queue", request_type="POST"
-        )
+        log = QUEUE_LOG.bind(request_type="POST")
         parsed_obj = request.parsed_obj  # noqa: F841
 
         queue = self._queue_service.create(
@@ -128,6 +140,9 @@ class QueueEndpoint(Resource):
 @api.route("/<int:id>")
 @api.param("id", "ID for the Queue resource.")
 class QueueIdEndpoint(Resource):
+    # See QueueEndpoint: stateless, so one instance serves all requests.
+    init_every_request = False
+
     @inject
     def __init__(self, queue_id_service: QueueIdService, *args, **kwargs) -> None:
         """Initialize the queue resource.
@@ -141,45 +156,64 @@ class QueueIdEndpoint(Resource):
         super().__init__(*args, **kwargs)
 
     @login_required
-    @responds(schema=QueueSchema, api=api)
+    @responds(schema=_QUEUE_SCHEMA, api=api)
     def get(self, id: int):
         """Gets a Queue resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Queue", request_type="GET", id=id
+        log = QUEUE_LOG.bind(request_type="GET", id=id)
+        # error_if_not_found=True guarantees a non-None result; a typed
+        # assignment avoids the runtime cast() call on this hot path.
+        queue: utils.QueueDict = self._queue_id_service.get(  # type: ignore[assignment]
+            id, error_if_not_found=True, log=log
+        )
+
+        # The etag covers everything that can change the serialized response:
+        # the latest snapshot id, the draft flag, the resource's last modified
+        # time, and the attached tags.  Tag attach/detach mutates the resource
+        # without creating a new snapshot, so the snapshot id alone would keep
+        # returning 304 for a response body that has changed.
+        resource = queue["queue"].resource
+        tag_ids = ".".join(
+            str(tag_id) for tag_id in sorted(tag.tag_id for tag in queue["queue"].tags)
         )
-        queue = cast(
-            models.Queue,
-            self._queue_id_service.get(id, error_if_not_found=True, log=log),
+        etag = "{}-{}-{}-{}".format(
+            queue["queue"].resource_snapshot_id,
+            int(queue.get("has_draft") or 0),
+            resource.last_modified_on.timestamp(),
+            tag_ids,
         )
+
+        if request.if_none_match.contains_weak(etag):
+            log.debug("Queue unchanged, skipping response body", etag=etag)
+            return Response(status=304, headers={"ETag": quote_etag(etag, weak=True)})
+
+        @after_this_request
+        def set_etag_header(response):
+            response.headers["ETag"] = quote_etag(etag, weak=True)
+            return response
+
         return utils.build_queue(queue)
 
     @login_required
-    @responds(schema=IdStatusResponseSchema, api=api)
+    @responds(schema=_ID_STATUS_RESPONSE_SCHEMA, api=api)
     def delete(self, id: int):
         """Deletes a Queue resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Queue", request_type="DELETE", id=id
-        )
+        log = QUEUE_LOG.bind(request_type="DELETE", id=id)
         return self._queue_id_service.delete(queue_id=id, log=log)
 
     @login_required
-    @accepts(schema=QueueMutableFieldsSchema, api=api)
-    @responds(schema=QueueSchema, api=api)
+    @accepts(schema=_QUEUE_MUTABLE_FIELDS_SCHEMA, api=api)
+    @responds(schema=_QUEUE_SCHEMA, api=api)
     def put(self, id: int):
         """Modifies a Queue resource."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Queue", request_type="PUT", id=id
-        )
+        log = QUEUE_LOG.bind(request_type="PUT", id=id)
         parsed_obj = request.parsed_obj  # type: ignore
-        queue = cast(
-            models.Queue,
-            self._queue_id_service.modify(
-                id,
-                name=parsed_obj["name"],
-                description=parsed_obj["description"],
-                error_if_not_found=True,
-                log=log,
-            ),
+        # See get: error_if_not_found=True guarantees a non-None result.
+        queue: utils.QueueDict = self._queue_id_service.modify(  # type: ignore[assignment]
+            id,
+            name=parsed_obj["name"],
+            description=parsed_obj["description"],
+            error_if_not_found=True,
+            log=log,
         )
         return utils.build_queue(queue)
 
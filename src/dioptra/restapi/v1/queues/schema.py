@@ -15,7 +15,11 @@
 # ACCESS THE FULL CC BY 4.0 LICENSE HERE:
 # https://creativecommons.org/licenses/by/4.0/legalcode
 """The schemas for serializing/deserializing Queue resources."""
-from marshmallow import Schema, fields
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import unquote
+
+from marshmallow import Schema, fields, post_load
 
 from dioptra.restapi.v1.schemas import (
     BasePageSchema,
@@ -82,9 +86,39 @@ class QueuePageSchema(BasePageSchema):
     )
 
 
+@dataclass(slots=True)
+class QueueGetQueryParams:
+    """The deserialized query parameters for the GET method of the /queues endpoint.
+
+    A slotted dataclass is cheaper to allocate and access than a dict and gives
+    the controller attribute access with typo protection.
+    """
+
+    group_id: int | None
+    search: str
+    index: int
+    page_length: int
+
+
 class QueueGetQueryParameters(
     PagingQueryParametersSchema,
     GroupIdQueryParametersSchema,
     SearchQueryParametersSchema,
 ):
     """The query parameters for the GET method of the /queues endpoint."""
+
+    @post_load
+    def build_query_params(
+        self, data: dict[str, Any], **kwargs
+    ) -> QueueGetQueryParams:
+        """Bundle the deserialized query parameters into a QueueGetQueryParams.
+
+        The search string is percent-decoded here so it arrives at the
+        controller already decoded, exactly once.
+        """
+        return QueueGetQueryParams(
+            group_id=data["group_id"],
+            search=unquote(data["search"]),
+            index=data["index"],
+            page_length=data["page_length"],
+        )
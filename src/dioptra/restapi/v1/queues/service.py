@@ -150,28 +150,6 @@ class QueueService(object):
                 construct_sql_query_filters(search_string, SEARCHABLE_FIELDS)
             )
 
-        stmt = (
-            select(func.count(models.Queue.resource_id))
-            .join(models.Resource)
-            .where(
-                *filters,
-                models.Resource.is_deleted == False,  # noqa: E712
-                models.Resource.latest_snapshot_id == models.Queue.resource_snapshot_id,
-            )
-        )
-        total_num_queues = db.session.scalars(stmt).first()
-
-        if total_num_queues is None:
-            log.error(
-                "The database query returned a None when counting the number of "
-                "queues when it should return a number.",
-                sql=str(stmt),
-            )
-            raise BackendDatabaseError
-
-        if total_num_queues == 0:
-            return [], total_num_queues
-
         queues_stmt = (
             select(models.Queue)
             .join(models.Resource)
@@ -185,6 +163,36 @@ class QueueService(object):
         )
         queues = list(db.session.scalars(queues_stmt).all())
 
+        if page_index == 0 and len(queues) < page_length:
+            # The first page was not filled, so it already contains every
+            # matching queue and the separate COUNT query can be skipped.
+            total_num_queues: int = len(queues)
+        else:
+            stmt = (
+                select(func.count(models.Queue.resource_id))
+                .join(models.Resource)
+                .where(
+                    *filters,
+                    models.Resource.is_deleted == False,  # noqa: E712
+                    models.Resource.latest_snapshot_id
+                    == models.Queue.resource_snapshot_id,
+                )
+            )
+            count = db.session.scalars(stmt).first()
+
+            if count is None:
+                log.error(
+                    "The database query returned a None when counting the number of "
+                    "queues when it should return a number.",
+                    sql=str(stmt),
+                )
+                raise BackendDatabaseError
+
+            total_num_queues = count
+
+        if total_num_queues == 0:
+            return [], total_num_queues
+
         drafts_stmt = select(
             models.DraftResource.payload["resource_id"].as_string().cast(Integer)
         ).where(
@@ -302,12 +310,27 @@ class QueueIdService(object):
         """
         log: BoundLogger = kwargs.get("log", LOGGER.new())
 
-        queue_dict = self.get(queue_id, error_if_not_found=error_if_not_found, log=log)
+        # Fetch the latest snapshot directly instead of going through self.get,
+        # which also runs a draft-existence query whose result is not needed
+        # when modifying a queue.
+        stmt = (
+            select(models.Queue)
+            .join(models.Resource)
+            .where(
+                models.Queue.resource_id == queue_id,
+                models.Queue.resource_snapshot_id == models.Resource.latest_snapshot_id,
+                models.Resource.is_deleted == False,  # noqa: E712
+            )
+        )
+        queue = db.session.scalars(stmt).first()
+
+        if queue is None:
+            if error_if_not_found:
+                log.debug("Queue not found", queue_id=queue_id)
+                raise QueueDoesNotExistError
 
-        if queue_dict is None:
             return None
 
-        queue = queue_dict["queue"]
         group_id = queue.resource.group_id
         if (
             name != queue.name
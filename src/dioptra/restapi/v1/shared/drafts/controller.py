@@ -15,8 +15,7 @@
 # ACCESS THE FULL CC BY 4.0 LICENSE HERE:
 # https://creativecommons.org/licenses/by/4.0/legalcode
 """The module defining the endpoints for Drafts."""
-import uuid
-from functools import partial
+from functools import cached_property, partial
 from typing import Type, cast
 
 import structlog
@@ -70,6 +69,11 @@ def generate_resource_drafts_endpoint(
 
     @api.route("/drafts/")
     class ResourceDraftsEndpoint(Resource):
+        # Generated resources hold no per-request state (the draft service is
+        # built from values captured at generation time), so each class is
+        # instantiated once at startup and reused for every request.
+        init_every_request = False
+
         @inject
         def __init__(
             self,
@@ -77,17 +81,21 @@ def generate_resource_drafts_endpoint(
             *args,
             **kwargs,
         ) -> None:
-            self._draft_service = draft_service.build(resource_type=resource_name)
+            self._draft_service_builder = draft_service
             super().__init__(*args, **kwargs)
 
+        @cached_property
+        def _draft_service(self) -> ResourceDraftsService:
+            # Built lazily so the throwaway instance Flask creates while
+            # registering the route never invokes the builder.
+            return self._draft_service_builder.build(resource_type=resource_name)
+
         @login_required
         @accepts(query_params_schema=DraftGetQueryParameters, api=api)
         @responds(schema=DraftPageSchema, api=api)
         def get(self):
             """Gets the Drafts for the resource."""
-            log = LOGGER.new(
-                request_id=str(uuid.uuid4()), resource="Draft", request_type="GET"
-            )
+            log = LOGGER.new(resource="Draft", request_type="GET")
             parsed_query_params = request.parsed_query_params  # noqa: F841
 
             draft_type = parsed_query_params["draft_type"].value
@@ -122,9 +130,7 @@ def generate_resource_drafts_endpoint(
         @responds(schema=DraftSchema, api=api)
         def post(self):
             """Creates a Draft for the resource."""
-            log = LOGGER.new(
-                request_id=str(uuid.uuid4()), resource="Draft", request_type="POST"
-            )
+            log = LOGGER.new(resource="Draft", request_type="POST")
             parsed_obj = request.parsed_obj  # noqa: F841
             draft = self._draft_service.create(None, parsed_obj, log=log)
             return utils.build_resource_draft(draft, draft_schema=request_schema)
@@ -158,6 +164,11 @@ def generate_resource_drafts_id_endpoint(
     @api.route("/drafts/<int:draftId>")
     @api.param("draftId", f"ID for the Draft of the {resource_name} resource.")
     class ResourcesDraftsIdEndpoint(Resource):
+        # Generated resources hold no per-request state (the draft service is
+        # built from values captured at generation time), so each class is
+        # instantiated once at startup and reused for every request.
+        init_every_request = False
+
         @inject
         def __init__(
             self,
@@ -165,16 +176,20 @@ def generate_resource_drafts_id_endpoint(
             *args,
             **kwargs,
         ) -> None:
-            self._draft_id_service = draft_id_service.build(resource_type=resource_name)
+            self._draft_id_service_builder = draft_id_service
             super().__init__(*args, **kwargs)
 
+        @cached_property
+        def _draft_id_service(self) -> ResourceDraftsIdService:
+            # Built lazily so the throwaway instance Flask creates while
+            # registering the route never invokes the builder.
+            return self._draft_id_service_builder.build(resource_type=resource_name)
+
         @login_required
         @responds(schema=DraftSchema, api=api)
         def get(self, draftId: int):
             """Gets a Draft for the resource."""
-            log = LOGGER.new(
-                request_id=str(uuid.uuid4()), resource="Draft", request_type="GET"
-            )
+            log = LOGGER.new(resource="Draft", request_type="GET")
             draft = self._draft_id_service.get(
                 draftId, error_if_not_found=True, log=log
             )
@@ -187,9 +202,7 @@ def generate_resource_drafts_id_endpoint(
         @responds(schema=DraftSchema, api=api)
         def put(self, draftId: int):
             """Modifies a Draft for the resource."""
-            log = LOGGER.new(
-                request_id=str(uuid.uuid4()), resource="Draft", request_type="POST"
-            )
+            log = LOGGER.new(resource="Draft", request_type="POST")
             parsed_obj = request.parsed_obj  # type: ignore
             draft = self._draft_id_service.modify(draftId, payload=parsed_obj, log=log)
             return utils.build_resource_draft(
@@ -200,9 +213,7 @@ def generate_resource_drafts_id_endpoint(
         @responds(schema=IdStatusResponseSchema, api=api)
         def delete(self, draftId: int):
             """Deletes a Draft for the resource."""
-            log = LOGGER.new(
-                request_id=str(uuid.uuid4()), resource="Draft", request_type="DELETE"
-            )
+            log = LOGGER.new(resource="Draft", request_type="DELETE")
             return self._draft_id_service.delete(draftId, log=log)
 
     return ResourcesDraftsIdEndpoint
@@ -234,6 +245,11 @@ def generate_resource_id_draft_endpoint(
     @api.route("/<int:id>/draft")
     @api.param("id", "ID for the resource.")
     class ResourcesIdDraftEndpoint(Resource):
+        # Generated resources hold no per-request state (the draft service is
+        # built from values captured at generation time), so each class is
+        # instantiated once at startup and reused for every request.
+        init_every_request = False
+
         @inject
         def __init__(
             self,
@@ -241,16 +257,20 @@ def generate_resource_id_draft_endpoint(
             *args,
             **kwargs,
         ) -> None:
-            self._id_draft_service = id_draft_service.build(resource_type=resource_name)
+            self._id_draft_service_builder = id_draft_service
             super().__init__(*args, **kwargs)
 
+        @cached_property
+        def _id_draft_service(self) -> ResourceIdDraftService:
+            # Built lazily so the throwaway instance Flask creates while
+            # registering the route never invokes the builder.
+            return self._id_draft_service_builder.build(resource_type=resource_name)
+
         @login_required
         @responds(schema=DraftSchema, api=api)
         def get(self, id: int):
             """Gets the Draft for this resource."""
-            log = LOGGER.new(
-                request_id=str(uuid.uuid4()), resource="Draft", request_type="GET"
-            )
+            log = LOGGER.new(resource="Draft", request_type="GET")
             draft, num_other_drafts = self._id_draft_service.get(
                 id, error_if_not_found=True, log=log
             )
@@ -263,9 +283,7 @@ def generate_resource_id_draft_endpoint(
         @responds(schema=DraftSchema, api=api)
         def post(self, id: int):
             """Creates a Draft for this resource."""
-            log = LOGGER.new(
-                request_id=str(uuid.uuid4()), resource="Draft", request_type="POST"
-            )
+            log = LOGGER.new(resource="Draft", request_type="POST")
             parsed_obj = request.parsed_obj  # type: ignore
             draft, num_other_drafts = self._id_draft_service.create(
                 id, base_resource_id=None, payload=parsed_obj, log=log
@@ -279,9 +297,7 @@ def generate_resource_id_draft_endpoint(
         @responds(schema=DraftSchema, api=api)
         def put(self, id: int):
             """Modifies the Draft for this resource."""
-            log = LOGGER.new(
-                request_id=str(uuid.uuid4()), resource="Draft", request_type="POST"
-            )
+            log = LOGGER.new(resource="Draft", request_type="POST")
             parsed_obj = request.parsed_obj  # type: ignore
             draft, num_other_drafts = self._id_draft_service.modify(
                 id, payload=parsed_obj, error_if_not_found=True, log=log
@@ -294,9 +310,7 @@ def generate_resource_id_draft_endpoint(
         @responds(schema=IdStatusResponseSchema, api=api)
         def delete(self, id: int):
             """Deletes the Draft for this resource."""
-            log = LOGGER.new(
-                request_id=str(uuid.uuid4()), resource="Draft", request_type="DELETE"
-            )
+            log = LOGGER.new(resource="Draft", request_type="DELETE")
             return self._id_draft_service.delete(id, log=log)
 
     return ResourcesIdDraftEndpoint
@@ -335,6 +349,11 @@ def generate_nested_resource_drafts_endpoint(
 
     @api.route(f"/<int:id>/{resource_route}/drafts/")
     class ResourceDraftsEndpoint(Resource):
+        # Generated resources hold no per-request state (the draft service is
+        # built from values captured at generation time), so each class is
+        # instantiated once at startup and reused for every request.
+        init_every_request = False
+
         @inject
         def __init__(
             self,
@@ -342,17 +361,21 @@ def generate_nested_resource_drafts_endpoint(
             *args,
             **kwargs,
         ) -> None:
-            self._draft_service = draft_service.build(resource_type=resource_name)
+            self._draft_service_builder = draft_service
             super().__init__(*args, **kwargs)
 
+        @cached_property
+        def _draft_service(self) -> ResourceDraftsService:
+            # Built lazily so the throwaway instance Flask creates while
+            # registering the route never invokes the builder.
+            return self._draft_service_builder.build(resource_type=resource_name)
+
         @login_required
         @accepts(query_params_schema=DraftGetQueryParameters, api=api)
         @responds(schema=DraftPageSchema, api=api)
         def get(self, id: int):
             """Gets the Drafts for the resource."""
-            log = LOGGER.new(
-                request_id=str(uuid.uuid4()), resource="Draft", request_type="GET"
-            )
+            log = LOGGER.new(resource="Draft", request_type="GET")
             parsed_query_params = request.parsed_query_params  # type: ignore
 
             draft_type = parsed_query_params["draft_type"].value
@@ -387,9 +410,7 @@ def generate_nested_resource_drafts_endpoint(
         @responds(schema=DraftSchema, api=api)
         def post(self, id: int):
             """Creates a Draft for the resource."""
-            log = LOGGER.new(
-                request_id=str(uuid.uuid4()), resource="Draft", request_type="POST"
-            )
+            log = LOGGER.new(resource="Draft", request_type="POST")
             parsed_obj = request.parsed_obj  # type: ignore
             draft = self._draft_service.create(id, parsed_obj, log=log)
             return utils.build_resource_draft(draft, draft_schema=request_schema)
@@ -429,6 +450,11 @@ def generate_nested_resource_drafts_id_endpoint(
     @api.route(f"/<int:id>/{resource_route}/drafts/<int:draftId>")
     @api.param("draftId", f"ID for the Draft of the {resource_name} resource.")
     class ResourcesDraftsIdEndpoint(Resource):
+        # Generated resources hold no per-request state (the draft service is
+        # built from values captured at generation time), so each class is
+        # instantiated once at startup and reused for every request.
+        init_every_request = False
+
         @inject
         def __init__(
             self,
@@ -436,16 +462,20 @@ def generate_nested_resource_drafts_id_endpoint(
             *args,
             **kwargs,
         ) -> None:
-            self._draft_id_service = draft_id_service.build(resource_type=resource_name)
+            self._draft_id_service_builder = draft_id_service
             super().__init__(*args, **kwargs)
 
+        @cached_property
+        def _draft_id_service(self) -> ResourceDraftsIdService:
+            # Built lazily so the throwaway instance Flask creates while
+            # registering the route never invokes the builder.
+            return self._draft_id_service_builder.build(resource_type=resource_name)
+
         @login_required
         @responds(schema=DraftSchema, api=api)
         def get(self, id: int, draftId: int):
             """Gets a Draft for the resource."""
-            log = LOGGER.new(
-                request_id=str(uuid.uuid4()), resource="Draft", request_type="GET"
-            )
+            log = LOGGER.new(resource="Draft", request_type="GET")
             draft = self._draft_id_service.get(
                 draftId, error_if_not_found=True, log=log
             )
@@ -458,9 +488,7 @@ def generate_nested_resource_drafts_id_endpoint(
         @responds(schema=DraftSchema, api=api)
         def put(self, id: int, draftId: int):
             """Modifies a Draft for the resource."""
-            log = LOGGER.new(
-                request_id=str(uuid.uuid4()), resource="Draft", request_type="POST"
-            )
+            log = LOGGER.new(resource="Draft", request_type="POST")
             parsed_obj = request.parsed_obj  # type: ignore
             draft = self._draft_id_service.modify(draftId, payload=parsed_obj, log=log)
             return utils.build_resource_draft(
@@ -471,9 +499,7 @@ def generate_nested_resource_drafts_id_endpoint(
         @responds(schema=IdStatusResponseSchema, api=api)
         def delete(self, id: int, draftId: int):
             """Deletes a Draft for the resource."""
-            log = LOGGER.new(
-                request_id=str(uuid.uuid4()), resource="Draft", request_type="DELETE"
-            )
+            log = LOGGER.new(resource="Draft", request_type="DELETE")
             return self._draft_id_service.delete(draftId, log=log)
 
     return ResourcesDraftsIdEndpoint
@@ -514,6 +540,11 @@ def generate_nested_resource_id_draft_endpoint(
     @api.route(f"/<int:id>/{resource_route}/<int:{resource_id}>/draft")
     @api.param("id", "ID for the resource.")
     class ResourcesIdDraftEndpoint(Resource):
+        # Generated resources hold no per-request state (the draft service is
+        # built from values captured at generation time), so each class is
+        # instantiated once at startup and reused for every request.
+        init_every_request = False
+
         @inject
         def __init__(
             self,
@@ -521,16 +552,20 @@ def generate_nested_resource_id_draft_endpoint(
             *args,
             **kwargs,
         ) -> None:
-            self._id_draft_service = id_draft_service.build(resource_type=resource_name)
+            self._id_draft_service_builder = id_draft_service
             super().__init__(*args, **kwargs)
 
+        @cached_property
+        def _id_draft_service(self) -> ResourceIdDraftService:
+            # Built lazily so the throwaway instance Flask creates while
+            # registering the route never invokes the builder.
+            return self._id_draft_service_builder.build(resource_type=resource_name)
+
         @login_required
         @responds(schema=DraftSchema, api=api)
         def get(self, id: int, **kwargs):
             """Gets the Draft for this resource."""
-            log = LOGGER.new(
-                request_id=str(uuid.uuid4()), resource="Draft", request_type="GET"
-            )
+            log = LOGGER.new(resource="Draft", request_type="GET")
             if set(kwargs.keys()) != set([resource_id]):
                 unexpected_kwargs = {
                     k: v for k, v in kwargs.items() if resource_id != k
@@ -553,9 +588,7 @@ def generate_nested_resource_id_draft_endpoint(
         @responds(schema=DraftSchema, api=api)
         def post(self, id: int, **kwargs):
             """Creates a Draft for this resource."""
-            log = LOGGER.new(
-                request_id=str(uuid.uuid4()), resource="Draft", request_type="POST"
-            )
+            log = LOGGER.new(resource="Draft", request_type="POST")
             if set(kwargs.keys()) != set([resource_id]):
                 unexpected_kwargs = {
                     k: v for k, v in kwargs.items() if resource_id != k
@@ -579,9 +612,7 @@ def generate_nested_resource_id_draft_endpoint(
         @responds(schema=DraftSchema, api=api)
         def put(self, id: int, **kwargs):
             """Modifies the Draft for this resource."""
-            log = LOGGER.new(
-                request_id=str(uuid.uuid4()), resource="Draft", request_type="POST"
-            )
+            log = LOGGER.new(resource="Draft", request_type="POST")
             if set(kwargs.keys()) != set([resource_id]):
                 unexpected_kwargs = {
                     k: v for k, v in kwargs.items() if resource_id != k
@@ -607,9 +638,7 @@ def generate_nested_resource_id_draft_endpoint(
         @responds(schema=IdStatusResponseSchema, api=api)
         def delete(self, id: int, **kwargs):
             """Deletes the Draft for this resource."""
-            log = LOGGER.new(
-                request_id=str(uuid.uuid4()), resource="Draft", request_type="DELETE"
-            )
+            log = LOGGER.new(resource="Draft", request_type="DELETE")
             if set(kwargs.keys()) != set([resource_id]):
                 unexpected_kwargs = {
                     k: v for k, v in kwargs.items() if resource_id != k
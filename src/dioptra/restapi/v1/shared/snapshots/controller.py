@@ -15,7 +15,6 @@
 # ACCESS THE FULL CC BY 4.0 LICENSE HERE:
 # https://creativecommons.org/licenses/by/4.0/legalcode
 """The module defining the endpoints for Snapshots."""
-import uuid
 from typing import Any, Callable, Type, cast
 from urllib.parse import unquote
 
@@ -93,9 +92,7 @@ def generate_resource_snapshots_endpoint(
         @responds(schema=page_schema, model_name=model_name, api=api)
         def get(self, id: int):
             """Gets the Snapshots for the resource."""
-            log = LOGGER.new(
-                request_id=str(uuid.uuid4()), resource="Snapshots", request_type="GET"
-            )
+            log = LOGGER.new(resource="Snapshots", request_type="GET")
 
             parsed_query_params = request.parsed_query_params  # type: ignore
             search_string = unquote(parsed_query_params["search"])
@@ -179,9 +176,7 @@ def generate_resource_snapshots_id_endpoint(
         @responds(schema=response_schema, model_name=model_name, api=api)
         def get(self, id: int, snapshotId: int):
             """Gets a Snapshot for the resource by snapshot id."""
-            log = LOGGER.new(
-                request_id=str(uuid.uuid4()), resource="Snapshots", request_type="GET"
-            )
+            log = LOGGER.new(resource="Snapshots", request_type="GET")
             snapshot = cast(
                 models.ResourceSnapshot,
                 self._snapshots_id_service.get(
@@ -256,9 +251,7 @@ def generate_nested_resource_snapshots_endpoint(
         @responds(schema=page_schema, model_name=model_name, api=api)
         def get(self, id: int, **kwargs):
             """Gets the Snapshots for the resource."""
-            log = LOGGER.new(
-                request_id=str(uuid.uuid4()), resource="Snapshots", request_type="GET"
-            )
+            log = LOGGER.new(resource="Snapshots", request_type="GET")
             if set(kwargs.keys()) != set([resource_id]):
                 unexpected_kwargs = {
                     k: v for k, v in kwargs.items() if resource_id != k
@@ -359,9 +352,7 @@ def generate_nested_resource_snapshots_id_endpoint(
         @responds(schema=response_schema, model_name=model_name, api=api)
         def get(self, id: int, snapshotId: int, **kwargs):
             """Gets a Snapshot for the resource by snapshot id."""
-            log = LOGGER.new(
-                request_id=str(uuid.uuid4()), resource="Snapshots", request_type="GET"
-            )
+            log = LOGGER.new(resource="Snapshots", request_type="GET")
             if set(kwargs.keys()) != set([resource_id]):
                 unexpected_kwargs = {
                     k: v for k, v in kwargs.items() if resource_id != k
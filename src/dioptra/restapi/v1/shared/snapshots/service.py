@@ -99,28 +99,6 @@ class ResourceSnapshotsService(object):
                 construct_sql_query_filters(search_string, self._searchable_fields)
             )
 
-        stmt = (
-            select(func.count(self.resource_model.resource_id))  # type: ignore
-            .join(models.Resource)
-            .where(
-                *filters,
-                models.Resource.resource_id == resource_id,
-                models.Resource.is_deleted == False,  # noqa: E712
-            )
-        )
-        total_num_snapshots = db.session.scalars(stmt).unique().first()
-
-        if total_num_snapshots is None:
-            log.error(
-                "The database query returned a None when counting the number of "
-                "snapshots when it should return a number.",
-                sql=str(stmt),
-            )
-            raise BackendDatabaseError
-
-        if total_num_snapshots == 0:
-            return [], total_num_snapshots
-
         stmt = (
             select(self.resource_model)
             .join(models.Resource)
@@ -138,6 +116,35 @@ class ResourceSnapshotsService(object):
             for snapshot in db.session.scalars(stmt).unique()
         ]
 
+        if page_index == 0 and len(snapshots) < page_length:
+            # The first page was not filled, so it already contains every
+            # matching snapshot and the separate COUNT query can be skipped.
+            # Fusing the count into the paged query with a window function is
+            # not an option here because the joined eager loads on some
+            # snapshot models duplicate rows before deduplication.
+            total_num_snapshots: int = len(snapshots)
+        else:
+            stmt = (
+                select(func.count(self.resource_model.resource_id))  # type: ignore
+                .join(models.Resource)
+                .where(
+                    *filters,
+                    models.Resource.resource_id == resource_id,
+                    models.Resource.is_deleted == False,  # noqa: E712
+                )
+            )
+            count = db.session.scalars(stmt).unique().first()
+
+            if count is None:
+                log.error(
+                    "The database query returned a None when counting the number of "
+                    "snapshots when it should return a number.",
+                    sql=str(stmt),
+                )
+                raise BackendDatabaseError
+
+            total_num_snapshots = count
+
         return snapshots, total_num_snapshots
 
 
@@ -17,7 +17,6 @@
 """The module defining the endpoints for Tags."""
 from __future__ import annotations
 
-import uuid
 
 import structlog
 from flask import request
@@ -70,9 +69,7 @@ def generate_resource_tags_endpoint(
         @responds(schema=TagRefSchema(many=True), api=api)
         def get(self, id: int):
             """Gets the list of Tags for the resource."""
-            log = LOGGER.new(
-                request_id=str(uuid.uuid4()), resource="Tag", request_type="GET"
-            )
+            log = LOGGER.new(resource="Tag", request_type="GET")
             tags = self._tag_service.get(id, log=log)
             return utils.build_tag_ref_list(tags)
 
@@ -81,9 +78,7 @@ def generate_resource_tags_endpoint(
         @responds(schema=TagRefSchema(many=True), api=api)
         def post(self, id: int):
             """Appends one or more Tags to the resource."""
-            log = LOGGER.new(
-                request_id=str(uuid.uuid4()), resource="Tag", request_type="POST"
-            )
+            log = LOGGER.new(resource="Tag", request_type="POST")
             parsed_obj = request.parsed_obj  # type: ignore
             tags = self._tag_service.append(
                 id, tag_ids=parsed_obj["ids"], error_if_not_found=True, log=log
@@ -95,9 +90,7 @@ def generate_resource_tags_endpoint(
         @responds(schema=TagRefSchema(many=True), api=api)
         def put(self, id: int):
             """Replaces one or more Tags to the resource."""
-            log = LOGGER.new(
-                request_id=str(uuid.uuid4()), resource="Tag", request_type="POST"
-            )
+            log = LOGGER.new(resource="Tag", request_type="POST")
             parsed_obj = request.parsed_obj  # type: ignore
             tags = self._tag_service.modify(
                 id, tag_ids=parsed_obj["ids"], error_if_not_found=True, log=log
@@ -108,9 +101,7 @@ def generate_resource_tags_endpoint(
         @responds(schema=IdStatusResponseSchema, api=api)
         def delete(self, id: int):
             """Removes all Tags from the resource."""
-            log = LOGGER.new(
-                request_id=str(uuid.uuid4()), resource="Tag", request_type="DELETE"
-            )
+            log = LOGGER.new(resource="Tag", request_type="DELETE")
             return self._tag_service.delete(id, error_if_not_found=True, log=log)
 
     return ResourcesTagsEndpoint
@@ -149,9 +140,7 @@ def generate_resource_tags_id_endpoint(
         @responds(schema=IdStatusResponseSchema, api=api)
         def delete(self, id: int, tagId: int):
             """Removes a Tag from the resource."""
-            log = LOGGER.new(
-                request_id=str(uuid.uuid4()), resource="Tag", request_type="GET"
-            )
+            log = LOGGER.new(resource="Tag", request_type="GET")
             return self._tag_id_service.delete(id, tagId, log=log)
 
     return ResourcesTagsIdEndpoint
@@ -197,9 +186,7 @@ def generate_nested_resource_tags_endpoint(
         @responds(schema=TagRefSchema(many=True), api=api)
         def get(self, id: int, **kwargs):
             """Gets the list of Tags for the resource."""
-            log = LOGGER.new(
-                request_id=str(uuid.uuid4()), resource="Tag", request_type="GET"
-            )
+            log = LOGGER.new(resource="Tag", request_type="GET")
             if set(kwargs.keys()) != set([resource_id]):
                 unexpected_kwargs = {
                     k: v for k, v in kwargs.items() if resource_id != k
@@ -218,9 +205,7 @@ def generate_nested_resource_tags_endpoint(
         @responds(schema=TagRefSchema(many=True), api=api)
         def post(self, id: int, **kwargs):
             """Appends one or more Tags to the resource."""
-            log = LOGGER.new(
-                request_id=str(uuid.uuid4()), resource="Tag", request_type="POST"
-            )
+            log = LOGGER.new(resource="Tag", request_type="POST")
             if set(kwargs.keys()) != set([resource_id]):
                 unexpected_kwargs = {
                     k: v for k, v in kwargs.items() if resource_id != k
@@ -245,9 +230,7 @@ def generate_nested_resource_tags_endpoint(
         @responds(schema=TagRefSchema(many=True), api=api)
         def put(self, id: int, **kwargs):
             """Replaces one or more Tags to the resource."""
-            log = LOGGER.new(
-                request_id=str(uuid.uuid4()), resource="Tag", request_type="POST"
-            )
+            log = LOGGER.new(resource="Tag", request_type="POST")
             if set(kwargs.keys()) != set([resource_id]):
                 unexpected_kwargs = {
                     k: v for k, v in kwargs.items() if resource_id != k
@@ -271,9 +254,7 @@ def generate_nested_resource_tags_endpoint(
         @responds(schema=IdStatusResponseSchema, api=api)
         def delete(self, id: int, **kwargs):
             """Removes all Tags from the resource."""
-            log = LOGGER.new(
-                request_id=str(uuid.uuid4()), resource="Tag", request_type="DELETE"
-            )
+            log = LOGGER.new(resource="Tag", request_type="DELETE")
             if set(kwargs.keys()) != set([resource_id]):
                 unexpected_kwargs = {
                     k: v for k, v in kwargs.items() if resource_id != k
@@ -332,9 +313,7 @@ def generate_nested_resource_tags_id_endpoint(
         @responds(schema=IdStatusResponseSchema, api=api)
         def delete(self, id: int, tagId: int, **kwargs):
             """Removes a Tag from the resource."""
-            log = LOGGER.new(
-                request_id=str(uuid.uuid4()), resource="Tag", request_type="DELETE"
-            )
+            log = LOGGER.new(resource="Tag", request_type="DELETE")
             if set(kwargs.keys()) != set([resource_id]):
                 unexpected_kwargs = {
                     k: v for k, v in kwargs.items() if resource_id != k
@@ -17,7 +17,6 @@
 """The module defining the endpoints for Tag resources."""
 from __future__ import annotations
 
-import uuid
 from typing import cast
 from urllib.parse import unquote
 
@@ -66,9 +65,7 @@ class TagEndpoint(Resource):
     @responds(schema=TagPageSchema, api=api)
     def get(self):
         """Gets a list of all Tags."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Tag", request_type="GET"
-        )
+        log = LOGGER.new(resource="Tag", request_type="GET")
         parsed_query_params = request.parsed_query_params  # noqa: F841
 
         group_id = parsed_query_params["group_id"]
@@ -100,9 +97,7 @@ class TagEndpoint(Resource):
     @responds(schema=TagSchema, api=api)
     def post(self):
         """Creates a Tag."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Tag", request_type="POST"
-        )
+        log = LOGGER.new(resource="Tag", request_type="POST")
         parsed_obj = request.parsed_obj  # noqa: F841
 
         tag = self._tag_service.create(
@@ -132,9 +127,7 @@ class TagIdEndpoint(Resource):
     @responds(schema=TagSchema, api=api)
     def get(self, id: int):
         """Gets a Tag."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Tag", request_type="GET", id=id
-        )
+        log = LOGGER.new(resource="Tag", request_type="GET", id=id)
         tag = cast(
             models.Tag,
             self._tag_id_service.get(id, error_if_not_found=True, log=log),
@@ -145,9 +138,7 @@ class TagIdEndpoint(Resource):
     @responds(schema=IdStatusResponseSchema, api=api)
     def delete(self, id: int):
         """Deletes a Tag."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Tag", request_type="DELETE", id=id
-        )
+        log = LOGGER.new(resource="Tag", request_type="DELETE", id=id)
         return self._tag_id_service.delete(tag_id=id, error_if_not_found=True, log=log)
 
     @login_required
@@ -155,9 +146,7 @@ class TagIdEndpoint(Resource):
     @responds(schema=TagSchema, api=api)
     def put(self, id: int):
         """Modifies a Tag."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Tag", request_type="PUT", id=id
-        )
+        log = LOGGER.new(resource="Tag", request_type="PUT", id=id)
         log.debug("Request received")
         parsed_obj = request.parsed_obj  # type: ignore
         tag = cast(
@@ -194,9 +183,7 @@ class TagIdResourceEndpoint(Resource):
     @responds(schema=ResourceUrlsPageSchema, api=api)
     def get(self, id: int):
         """Gets all Resources labeled with this Tag."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="Tag", request_type="GET", id=id
-        )
+        log = LOGGER.new(resource="Tag", request_type="GET", id=id)
         parsed_query_params = request.parsed_query_params  # type: ignore # noqa: F841
 
         resource_type = parsed_query_params["resource_type"]
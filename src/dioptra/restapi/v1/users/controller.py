@@ -15,7 +15,6 @@
 # ACCESS THE FULL CC BY 4.0 LICENSE HERE:
 # https://creativecommons.org/licenses/by/4.0/legalcode
 """The module defining the endpoints for User resources."""
-import uuid
 from typing import Any, cast
 from urllib.parse import unquote
 
@@ -66,9 +65,7 @@ class UserEndpoint(Resource):
     @responds(schema=UserPageSchema, api=api)
     def get(self):
         """Gets a list of all Users."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="User", request_type="GET"
-        )
+        log = LOGGER.new(resource="User", request_type="GET")
         parsed_query_params = request.parsed_query_params  # noqa: F841
 
         search_string = unquote(parsed_query_params["search"])
@@ -97,9 +94,7 @@ class UserEndpoint(Resource):
     @responds(schema=UserCurrentSchema, api=api)
     def post(self):
         """Creates a User."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="User", request_type="POST"
-        )
+        log = LOGGER.new(resource="User", request_type="POST")
         parsed_obj = request.parsed_obj  # noqa: F841
 
         user = self._user_service.create(
@@ -131,9 +126,7 @@ class UserIdEndpoint(Resource):
     @responds(schema=UserSchema, api=api)
     def get(self, id: int) -> dict[str, Any]:
         """Gets the User with the provided ID."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="User", request_type="GET", id=id
-        )
+        log = LOGGER.new(resource="User", request_type="GET", id=id)
         user = cast(
             models.User, self._user_id_service.get(id, error_if_not_found=True, log=log)
         )
@@ -160,9 +153,7 @@ class UserIdPasswordEndpoint(Resource):
     @responds(schema=IdStatusResponseSchema, api=api)
     def post(self, id: int):
         """Updates the User's password with a given ID."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="User", request_type="POST", id=id
-        )
+        log = LOGGER.new(resource="User", request_type="POST", id=id)
         parsed_obj = request.parsed_obj  # type: ignore # noqa: F841
         return self._user_id_service.change_password(
             user_id=id,
@@ -193,9 +184,7 @@ class UserCurrentEndpoint(Resource):
     @responds(schema=UserCurrentSchema, api=api)
     def get(self):
         """Gets the Current User."""
-        log = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="User", request_type="GET"
-        )
+        log = LOGGER.new(resource="User", request_type="GET")
         user = self._user_current_service.get(log=log)
         return utils.build_current_user(user)
 
@@ -205,7 +194,6 @@ class UserCurrentEndpoint(Resource):
     def delete(self) -> dict[str, Any]:
         """Deletes a Current User."""
         log: BoundLogger = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="User",
             request_type="DELETE",
         )
@@ -218,7 +206,6 @@ class UserCurrentEndpoint(Resource):
     def put(self) -> dict[str, Any]:
         """Modifies the Current User"""
         log: BoundLogger = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="User",
             request_type="PUT",
         )
@@ -254,7 +241,6 @@ class UserCurrentPasswordEndpoint(Resource):
     def post(self):
         """Updates the Current User's password."""
         log = LOGGER.new(
-            request_id=str(uuid.uuid4()),
             resource="User",
             request_type="POST",
         )
@@ -423,6 +423,13 @@ class UserCurrentService(object):
         log: BoundLogger = kwargs.get("log", LOGGER.new())
         log.debug("Modify user account", user_id=current_user.user_id)
 
+        if (
+            username == current_user.username
+            and email_address == current_user.email_address
+        ):
+            # Nothing changed, so skip the UPDATE and commit round trip.
+            return cast(models.User, current_user)
+
         current_timestamp = datetime.datetime.now(tz=datetime.timezone.utc)
         current_user.username = username
         current_user.email_address = email_address
@@ -15,7 +15,6 @@
 # ACCESS THE FULL CC BY 4.0 LICENSE HERE:
 # https://creativecommons.org/licenses/by/4.0/legalcode
 """The module defining the endpoints for Workflow resources."""
-import uuid
 
 import structlog
 from flask import request, send_file
@@ -54,7 +53,6 @@ class JobFilesDownloadEndpoint(Resource):
     def get(self):
         """Download a compressed file archive containing the files needed to execute a submitted job."""  # noqa: B950
         log = LOGGER.new(  # noqa: F841
-            request_id=str(uuid.uuid4()),
             resource="JobFilesDownload",
             request_type="GET",
         )
@@ -60,6 +60,7 @@ def clear_logger_handlers(logger: Optional[logging.Logger]) -> None:
 
 def configure_structlog() -> None:
     processors: List[Any] = [
+        structlog.contextvars.merge_contextvars,
         structlog.stdlib.filter_by_level,
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
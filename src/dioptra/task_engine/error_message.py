@@ -28,72 +28,139 @@ from typing import (
     Optional,
     Sequence,
     Union,
-    cast,
 )
 
 import jsonschema
 import jsonschema.exceptions
-import jsonschema.protocols
 import jsonschema.validators
 
+# Schemas handled here come from JSON/YAML parsers, which produce exactly the
+# builtin dict/list/str/int types, never subclasses.  That lets hot code paths
+# below use the cheaper "type(x) is dict" style checks in place of isinstance.
+
 # Type alias for general JSON schemas
 _JsonSchema = Union[dict[str, Any], bool]
 
 # Type alias for non-boolean JSON schemas
 _JsonSchemaNonBool = dict[str, Any]
 
+# Limit on the length of a single jsonschema error message line.  These
+# messages embed repr()s of the failing instance, which for large documents
+# can run to megabytes without adding any diagnostic value.
+_MAX_MESSAGE_LENGTH = 2000
+
 # Controls indentation of sub-parts of error messages
 _INDENT_SIZE = 4
 
+_INDENT_STR = " " * _INDENT_SIZE
+
+# Precomputed whitespace prefixes for the indentation levels seen in practice,
+# so writing a line doesn't allocate a fresh prefix string each time.
+_INDENT_TABLE = tuple(_INDENT_STR * n for n in range(32))
 
-def _indent_lines(lines: MutableSequence[str]) -> MutableSequence[str]:
+
+def _indent_prefix(indent: int) -> str:
     """
-    Add a level of indentation to each of the given lines.  The given
-    line sequence is modified in-place, and for convenience also returned.
+    Get the whitespace prefix for the given indentation level.
 
     Args:
-        lines: A mutable sequence of line strings
+        indent: An indentation level (a non-negative int)
 
     Returns:
-        The same sequence object as was passed in, but containing indented
-        lines.
+        A string of spaces
     """
-    for i, line in enumerate(lines):
-        lines[i] = " " * _INDENT_SIZE + line
+    if indent < len(_INDENT_TABLE):
+        return _INDENT_TABLE[indent]
 
-    return lines
+    return _INDENT_STR * indent
 
 
-def _schema_reference_to_path(ref: str) -> list[str]:
+def _elide_long_message(message: str) -> str:
     """
-    Convert a JSON-Schema reference to the same sort of path structure used in
-    jsonschema ValidationError objects to identify locations in JSON.  This
-    makes programmatically "following" the path to find what it refers to,
-    much easier.  The general path structure is a list of strings/ints.  This
-    implementation returns a list of strings and does not try to convert any
-    path components to any other type.  Absent context, all-digits path
-    components are ambiguous (keys or list indices?), so we mustn't change them.
+    Shorten a jsonschema error message if it is very long.  Such messages
+    embed a repr of the failing instance value, which for a large document
+    can be enormous while the diagnostically useful part is at the ends.
 
     Args:
-        ref: A reference value, as a fragment: "#" followed by a
-            JSON-Pointer value.  If the fragment is "#" by itself, return an
-            empty list.
+        message: An error message string
 
     Returns:
-        A path as a list of strings
+        The message unchanged if it is within _MAX_MESSAGE_LENGTH;
+        otherwise a shortened version with the middle elided
     """
+    if len(message) <= _MAX_MESSAGE_LENGTH:
+        return message
 
-    if ref == "#":
-        # I think "#" is legal, and refers to the whole document.
-        ref_schema_path = []
+    half = _MAX_MESSAGE_LENGTH // 2
+    num_elided = len(message) - 2 * half
 
-    else:
-        # Else, assume references start with "#/", i.e. are URL fragments
-        # containing JSON pointers which start with "/".
-        ref = ref[2:]  # strip the "#/"
-        ref_schema_path = ref.split("/")
+    return "{} ... ({} characters elided) ... {}".format(
+        message[:half], num_elided, message[-half:]
+    )
+
+
+# Maps id(full_schema) to the (validator class, resolver) pair used for the
+# mini-validations of oneOf alternatives.  Keying on object identity assumes
+# schema objects are long-lived; validation's memoized schema loader
+# guarantees that for the experiment description schema this module is used
+# with.  Callers bringing their own short-lived schemas should call
+# clear_caches() when discarding them.
+_validator_cache: dict[int, tuple[Any, Any]] = {}
 
-    return ref_schema_path
+# Maps (id(full_schema), ref) to the resolved referent sub-schema.  The same
+# identity-keying caveat as above applies.
+_ref_cache: dict[tuple[int, str], Any] = {}
+
+# Maps (id(full_schema), id(oneOf alternatives list)) to the computed
+# alternative names.  A batch of errors produced against the same oneOf
+# construct shares the same validator_value list object, so its names are
+# only computed once.
+_alt_names_cache: dict[tuple[int, int], list[str]] = {}
+
+
+def clear_caches() -> None:
+    """
+    Clear this module's internal caches.  Useful if schema objects are being
+    created and discarded dynamically, since cache entries are keyed on schema
+    object identity and would otherwise accumulate.
+    """
+    _validator_cache.clear()
+    _ref_cache.clear()
+    _alt_names_cache.clear()
+
+
+def _resolve_ref(ref: str, full_schema: _JsonSchemaNonBool) -> Any:
+    """
+    Resolve a "$ref" reference to the sub-schema it refers to, caching the
+    result so repeated references (e.g. many oneOf alternatives pointing at
+    the same definition) are only walked once per schema.
+
+    Args:
+        ref: A reference value, as a fragment: "#" followed by a JSON-Pointer
+            value
+        full_schema: The full schema the reference is relative to
+
+    Returns:
+        The referent sub-schema
+    """
+    key = (id(full_schema), ref)
+    referent = _ref_cache.get(key)
+
+    if referent is None:
+        if ref == "#":
+            # I think "#" is legal, and refers to the whole document.
+            ref_path: list[str] = []
+        else:
+            # Else, assume references start with "#/", i.e. are URL fragments
+            # containing JSON pointers which start with "/".  All-digits path
+            # components are ambiguous absent context (keys or list indices?),
+            # so they are left as strings for the extractor to interpret.
+            ref_path = ref[2:].split("/")
+
+        referent = _extract_schema_by_schema_path(ref_path, full_schema)
+        _ref_cache[key] = referent
+
+    return referent
 
 
 def _extract_schema_by_schema_path(
@@ -119,66 +186,42 @@ def _extract_schema_by_schema_path(
         The sub-part of schema referred to by the given path
     """
 
-    if schema is None:
-        schema = full_schema
-
-    if isinstance(schema, dict) and "$ref" in schema:
-        # jsonschema's schema paths don't actually contain "$ref" as an
-        # element.  The paths pass through as if the referent was substituted
-        # for the reference, and the reference wasn't even there.
-
-        # the cast here is necessary: _schema_reference_to_path() is defined
-        # to return list[str].  It never returns anything else, so I think it
-        # would be incorrect to define it otherwise.  Mypy regards lists as
-        # "invariant", i.e. list[A] and list[B] are considered incompatible
-        # types no matter the relationship between A and B.  It is effectively
-        # forcing the caller to never add anything other than strings to a
-        # list[str] since that's what the called function is declared to
-        # return.  In this case, the function may return me a list[str], but I
-        # know I will be sole owner of it, and so I should be able to do
-        # whatever I want with it, including adding values which are not
-        # strings, and use it in contexts where non-string content is expected
-        # (ints, in this case).
-        ref_schema_path: MutableSequence[Union[int, str]] = cast(
-            MutableSequence[Union[int, str]], _schema_reference_to_path(schema["$ref"])
-        )
-        # Here, schema_path may have integer list indices.  That's okay.
-        ref_schema_path.extend(schema_path)
-
-        result_schema = _extract_schema_by_schema_path(ref_schema_path, full_schema)
-
-    else:
-        schema_path_it = iter(schema_path)
-        next_path_component = next(schema_path_it, None)
-
-        if not next_path_component:
-            result_schema = schema
-
-        else:
-            if isinstance(schema, list):
-                # If current schema is a list, this path step must be
-                # interpretable as an integer.  We won't actually know whether
-                # a given path step which is a string comprised of all digits
-                # refers to an all-digits property name, or a list index, until
-                # this point.  This ambiguity occurs when splitting a JSON
-                # pointer string to obtain a schema path.
-                next_path_component = int(next_path_component)
-
-            # next_path_component is correctly inferred to be Union[int, str],
-            # but mypy does not consider that a valid index type.  Since
-            # 'schema' can have different values at runtime (sometimes lists,
-            # sometimes dicts), the below indexing can't always mean the same
-            # thing: sometimes it's a key lookup in a dict, sometimes an index
-            # lookup in a list.  As a static type checker, mypy seems to want
-            # one meaning, and I couldn't figure out how to make that pass mypy
-            # checks.
-            subschema = schema[next_path_component]  # type: ignore
-
-            result_schema = _extract_schema_by_schema_path(
-                schema_path_it, full_schema, subschema
-            )
-
-    return result_schema
+    node = full_schema if schema is None else schema
+    path = list(schema_path)
+    i = 0
+
+    while True:
+        if type(node) is dict and "$ref" in node:
+            # jsonschema's schema paths don't actually contain "$ref" as an
+            # element.  The paths pass through as if the referent was
+            # substituted for the reference, and the reference wasn't even
+            # there.  Resolve the reference (cached) and continue following
+            # the path from the referent.
+            node = _resolve_ref(node["$ref"], full_schema)
+            continue
+
+        if i >= len(path):
+            return node
+
+        step = path[i]
+        if type(node) is list:
+            # If current node is a list, this path step must be interpretable
+            # as an integer.  We won't actually know whether a given path step
+            # which is a string comprised of all digits refers to an
+            # all-digits property name, or a list index, until this point.
+            # This ambiguity occurs when splitting a JSON pointer string to
+            # obtain a schema path.
+            step = int(step)
+
+        # step is correctly inferred to be Union[int, str], but mypy does not
+        # consider that a valid index type.  Since 'node' can have different
+        # values at runtime (sometimes lists, sometimes dicts), the below
+        # indexing can't always mean the same thing: sometimes it's a key
+        # lookup in a dict, sometimes an index lookup in a list.  As a static
+        # type checker, mypy seems to want one meaning, and I couldn't figure
+        # out how to make that pass mypy checks.
+        node = node[step]  # type: ignore
+        i += 1
 
 
 def _get_one_of_alternative_names(
@@ -196,75 +239,89 @@ def _get_one_of_alternative_names(
             Important for being able to resolve references.
 
     Returns:
-        A list of names
+        A list of names.  Callers must not mutate it: the list is cached and
+        shared between calls with the same alternatives list object.
     """
 
-    # It is possible, though unlikely, that more than one alternative has the
-    # same name (title).  We will add a numeric counter suffix as necessary to
-    # force alternative names to be unique.
-    name_counts: MutableMapping[str, int] = collections.defaultdict(int)
-    names = []
+    cache_key = (id(full_schema), id(alternative_schemas))
+    cached_names = _alt_names_cache.get(cache_key)
+    if cached_names is not None:
+        return cached_names
+
+    titles = []
 
     for idx, alternative_schema in enumerate(alternative_schemas):
-        if isinstance(alternative_schema, dict):
-            # dereference if it's just a "$ref" schema
-            alternative_schema = _extract_schema_by_schema_path(
-                [], full_schema, alternative_schema
-            )
+        if type(alternative_schema) is dict:
+            # dereference if it's just a "$ref" schema; most alternatives
+            # aren't, so check directly instead of paying for a no-op walk of
+            # an empty path through the extractor.
+            if "$ref" in alternative_schema:
+                alternative_schema = _resolve_ref(
+                    alternative_schema["$ref"], full_schema
+                )
 
-            name = alternative_schema.get("title")
-            if not name:
-                name = "Alternative #" + str(idx + 1)
+            title = alternative_schema.get("title") or f"Alternative #{idx + 1}"
 
         else:
             # rare case... would only apply to true/false schemas I think.
-            name = "Alternative #" + str(idx + 1)
+            title = f"Alternative #{idx + 1}"
 
-        # uniquefy names, just in case...
-        name_count = name_counts[name]
-        name_counts[name] += 1
-        if name_count == 0:
-            names.append(name)
-        else:
-            names.append("{}({})".format(name, name_count + 1))
+        titles.append(title)
+
+    # It is possible, though unlikely, that more than one alternative has the
+    # same name (title).  Add a numeric counter suffix as necessary to force
+    # names to be unique; in the common all-unique case the titles are used
+    # as-is without a second pass.
+    title_counts = collections.Counter(titles)
+    if len(title_counts) == len(titles):
+        names = titles
+
+    else:
+        seen: dict[str, int] = {}
+        names = []
+        for title in titles:
+            if title_counts[title] == 1:
+                names.append(title)
+            else:
+                occurrence = seen.get(title, 0) + 1
+                seen[title] = occurrence
+                names.append(title if occurrence == 1 else f"{title}({occurrence})")
+
+    _alt_names_cache[cache_key] = names
 
     return names
 
 
-def _is_valid_for_sub_schema(
-    full_schema: _JsonSchemaNonBool, sub_schema: _JsonSchema, sub_instance: Any
-) -> bool:
+def _get_validator_parts(full_schema: _JsonSchemaNonBool) -> tuple[Any, Any]:
     """
-    Run a validation of document sub_instance against sub_schema.
+    Get the validator class and reference resolver for the given schema,
+    computing and caching them on first use.
 
     Args:
-        full_schema: The full schema, of which sub_schema is a part.
-            Important for being able to resolve references.
-        sub_schema: The schema to use for validation
-        sub_instance: The instance document to validate
+        full_schema: The full schema to validate against
 
     Returns:
-        True if sub_instance is valid; False if not
+        A (validator class, resolver) 2-tuple
     """
-    validator_class = jsonschema.validators.validator_for(full_schema)
-
-    # Without this type annotation, the is_valid() call below is treated as
-    # returning Any, and mypy errors since this function is defined to return
-    # bool!  Even with the jsonschema type stubs, mypy gets confused.
-    validator: jsonschema.protocols.Validator = validator_class(
-        schema=sub_schema,
-        # Need to construct a resolver from the full schema, since the
-        # sub-schema might contain references relative to the full schema,
-        # and we need to be able to resolve them.
-        resolver=jsonschema.validators.RefResolver.from_schema(full_schema),
-    )
+    cached = _validator_cache.get(id(full_schema))
+    if cached is None:
+        # Need to construct a resolver from the full schema, since sub-schemas
+        # might contain references relative to the full schema, and we need to
+        # be able to resolve them.  Both the validator class lookup and the
+        # resolver depend only on the full schema, so they are computed once
+        # per schema and cached.
+        cached = (
+            jsonschema.validators.validator_for(full_schema),
+            jsonschema.validators.RefResolver.from_schema(full_schema),
+        )
+        _validator_cache[id(full_schema)] = cached
 
-    return cast(bool, validator.is_valid(sub_instance))
+    return cached
 
 
-def _one_of_too_many_alternatives_satisfied_message_lines(
+def _one_of_too_many_alternatives_satisfied_message(
     error: jsonschema.exceptions.ValidationError, schema: _JsonSchemaNonBool
-) -> list[str]:
+) -> str:
     """
     Create an error message specifically about the situation where too many
     alternatives in a oneOf schema were valid.
@@ -275,36 +332,45 @@ def _one_of_too_many_alternatives_satisfied_message_lines(
         schema: The schema whose validation failed
 
     Returns:
-        An error message, as a list of lines (strings).  Returning a list
-        of lines is convenient for callers, who may want to nest this message
-        in another, with indented lines.
+        A one-line error message
     """
 
     alt_names = _get_one_of_alternative_names(error.validator_value, schema)
     error_desc = "Must be exactly one of: {}".format(", ".join(alt_names))
 
-    satisfied_alt_names = []
-    for alt_name, alt_schema in zip(alt_names, error.validator_value):
-        # Perform a little "mini" validation to determine which alternatives
-        # were satisfied, and describe them in the error message.
-        if _is_valid_for_sub_schema(schema, alt_schema, error.instance):
-            satisfied_alt_names.append(alt_name)
+    # Perform little "mini" validations to determine which alternatives were
+    # satisfied, and describe them in the error message.  This kind of error
+    # carries no context errors to infer the satisfied alternatives from, so
+    # re-validation is the only option; the validator class and resolver are
+    # looked up once here rather than per alternative.
+    validator_class, resolver = _get_validator_parts(schema)
+    satisfied_alt_names = [
+        alt_name
+        for alt_name, alt_schema in zip(alt_names, error.validator_value)
+        if validator_class(schema=alt_schema, resolver=resolver).is_valid(
+            error.instance
+        )
+    ]
 
     error_desc += ".  Content satisfied more than one alternative: {}.".format(
         ", ".join(satisfied_alt_names)
     )
 
-    return [error_desc]
+    return error_desc
 
 
 def _one_of_no_alternatives_satisfied_message_lines(
     error: jsonschema.exceptions.ValidationError,
     schema: _JsonSchemaNonBool,
     location_desc_callback: Callable[[Sequence[Union[int, str]]], str],
-) -> list[str]:
+    out: MutableSequence[str],
+    indent: int,
+    max_errors_per_alternative: Optional[int] = None,
+) -> None:
     """
     Create an error message specifically about the situation where none of the
-    alternatives in a oneOf schema were valid.
+    alternatives in a oneOf schema were valid.  Lines are written to "out",
+    pre-indented to the given indentation level.
 
     Args:
         error: The ValidationError object representing the aforementioned
@@ -314,14 +380,15 @@ def _one_of_no_alternatives_satisfied_message_lines(
             description of the location of errors.  Takes a programmatic "path"
             structure as a sequence of strings/ints, and should return a nice
             one-line string description.
-
-    Returns:
-        An error message, as a list of lines (strings).  Returning a list
-        of lines is convenient for callers, who may want to nest this message
-        in another, with indented lines.
+        out: A mutable sequence the message lines are appended to
+        indent: The indentation level to write lines at
+        max_errors_per_alternative: The maximum number of errors to describe
+            per oneOf alternative, or None for no limit.  Errors within one
+            alternative are usually highly redundant, so a small cap bounds
+            the message size for large instances with little loss of signal.
     """
 
-    message_lines = []
+    prefix = _indent_prefix(indent)
 
     # First error message line describes the error in basic terms.
 
@@ -330,15 +397,16 @@ def _one_of_no_alternatives_satisfied_message_lines(
         "Must be exactly one of: {}; all alternatives failed validation."
     ).format(", ".join(alt_names))
 
-    message_lines.append(basic_desc)
+    out.append(prefix + basic_desc)
 
     # Subsequent error lines give additional details about the error: errors
     # associated with each oneOf alternative sub-schema.
 
-    # Maps an alternative name to a list of error objects associated with that
-    # alternative.  We organize context errors according to the alternative
-    # they apply to.
-    errors_by_alt = collections.defaultdict(list)
+    # Maps an alternative's index to a list of error objects associated with
+    # that alternative.  Grouping by the int index keeps the per-error work
+    # down to a single path lookup; names are only resolved once per group
+    # when the headers are written below.
+    errors_by_alt: MutableMapping[int, list[Any]] = collections.defaultdict(list)
 
     one_of_schema_path_len = len(error.absolute_schema_path)
 
@@ -357,29 +425,61 @@ def _one_of_no_alternatives_satisfied_message_lines(
         # is not a valid index type.  As explained above, in this context, this
         # index must be an int.
         assert isinstance(error_alt_idx, int)
-        errors_by_alt[alt_names[error_alt_idx]].append(ctx_error)
-
-    for alt_name, alt_errors in errors_by_alt.items():
-        message_lines.append(
-            'Errors associated with alternative "{}":'.format(alt_name)
-        )
-
-        for alt_error in alt_errors:
-            sub_message_lines = _validation_error_to_message_lines(
-                alt_error, schema, location_desc_callback
-            )
-            message_lines.extend(_indent_lines(sub_message_lines))
-
-    return message_lines
+        errors_by_alt[error_alt_idx].append(ctx_error)
+
+    sub_prefix = _indent_prefix(indent + 1)
+
+    for alt_idx, alt_errors in errors_by_alt.items():
+        alt_name = alt_names[alt_idx]
+        out.append(prefix + f'Errors associated with alternative "{alt_name}":')
+
+        shown_errors = alt_errors
+        if (
+            max_errors_per_alternative is not None
+            and len(alt_errors) > max_errors_per_alternative
+        ):
+            shown_errors = alt_errors[:max_errors_per_alternative]
+
+        for alt_error in shown_errors:
+            if alt_error.validator != "oneOf":
+                # Leaf errors (the common case) always render as a single
+                # fallback line, so write it here directly rather than paying
+                # for a recursive call per sub-error.
+                out.append(
+                    sub_prefix
+                    + "In {}: {}".format(
+                        location_desc_callback(alt_error.absolute_path),
+                        _elide_long_message(alt_error.message),
+                    )
+                )
+            else:
+                _validation_error_to_message_lines(
+                    alt_error,
+                    schema,
+                    location_desc_callback,
+                    out,
+                    indent + 1,
+                    max_errors_per_alternative,
+                )
+
+        num_suppressed = len(alt_errors) - len(shown_errors)
+        if num_suppressed:
+            out.append(sub_prefix + f"... ({num_suppressed} more suppressed)")
 
 
 def _validation_error_to_message_lines(
     error: jsonschema.exceptions.ValidationError,
     schema: _JsonSchema,
     location_desc_callback: Callable[[Sequence[Union[int, str]]], str],
-) -> list[str]:
+    out: MutableSequence[str],
+    indent: int,
+    max_errors_per_alternative: Optional[int] = None,
+) -> None:
     """
-    Create a nice error message for the given error object.
+    Create a nice error message for the given error object.  Lines are written
+    to "out", pre-indented to the given indentation level.  Writing complete
+    lines into a shared buffer avoids re-copying every nested line once per
+    enclosing oneOf level, as the old build-then-indent approach did.
 
     Args:
         error: A ValidationError object which represents some schema
@@ -389,13 +489,14 @@ def _validation_error_to_message_lines(
             description of the location of errors.  Takes a programmatic "path"
             structure as a sequence of strings/ints, and should return a nice
             one-line string description.
-
-    Returns:
-        An error message, as a list of lines (strings).  Returning a list
-        of lines is convenient for callers, who may want to nest this message
-        in another, with indented lines.
+        out: A mutable sequence the message lines are appended to
+        indent: The indentation level to write lines at
+        max_errors_per_alternative: The maximum number of errors to describe
+            per oneOf alternative, or None for no limit
     """
 
+    prefix = _indent_prefix(indent)
+
     # Describe "where" the error occurred
     location_desc = location_desc_callback(error.absolute_path)
 
@@ -407,27 +508,25 @@ def _validation_error_to_message_lines(
         assert isinstance(schema, dict)
 
         if error.context:
-            what_lines = _one_of_no_alternatives_satisfied_message_lines(
-                error, schema, location_desc_callback
+            # This variant always produces multiple lines, nested one level
+            # deeper than the location description.
+            out.append(prefix + f"In {location_desc}:")
+            _one_of_no_alternatives_satisfied_message_lines(
+                error,
+                schema,
+                location_desc_callback,
+                out,
+                indent + 1,
+                max_errors_per_alternative,
             )
 
         else:
-            what_lines = _one_of_too_many_alternatives_satisfied_message_lines(
-                error, schema
-            )
+            what = _one_of_too_many_alternatives_satisfied_message(error, schema)
+            out.append(prefix + f"In {location_desc}: {what}")
 
     else:
         # fallback if we can't be more clever about our message
-        what_lines = [error.message]
-
-    if len(what_lines) == 1:
-        message_lines = ["In {}: {}".format(location_desc, what_lines[0])]
-
-    else:
-        message_lines = ["In {}:".format(location_desc)]
-        message_lines.extend(_indent_lines(what_lines))
-
-    return message_lines
+        out.append(prefix + f"In {location_desc}: {_elide_long_message(error.message)}")
 
 
 def json_path_to_string(path: Iterable[Any]) -> str:
@@ -452,6 +551,7 @@ def validation_error_to_message(
     error: jsonschema.exceptions.ValidationError,
     schema: _JsonSchema,
     location_desc_callback: Optional[Callable[[Sequence[Union[int, str]]], str]] = None,
+    max_errors_per_alternative: Optional[int] = None,
 ) -> str:
     """
     Create a nice error message for the given error object.
@@ -465,6 +565,9 @@ def validation_error_to_message(
             structure as a sequence of strings/ints, and should return a nice
             one-line string description.  Defaults to a simple generic
             implementation which produces descriptions which aren't very nice.
+        max_errors_per_alternative: The maximum number of errors to describe
+            per oneOf alternative, with a note about how many were suppressed.
+            Defaults to None, meaning no limit.
 
     Returns:
         An error message as a string
@@ -473,8 +576,14 @@ def validation_error_to_message(
     if location_desc_callback is None:
         location_desc_callback = json_path_to_string
 
-    message_lines = _validation_error_to_message_lines(
-        error, schema, location_desc_callback
+    message_lines: list[str] = []
+    _validation_error_to_message_lines(
+        error,
+        schema,
+        location_desc_callback,
+        message_lines,
+        0,
+        max_errors_per_alternative,
     )
 
     message = "\n".join(message_lines)
@@ -486,30 +595,50 @@ def validation_errors_to_message(
     errors: Iterable[jsonschema.exceptions.ValidationError],
     schema: _JsonSchema,
     location_desc_callback: Optional[Callable[[Sequence[Union[int, str]]], str]] = None,
+    max_errors_per_alternative: Optional[int] = None,
 ) -> str:
     """
-    Create a nice error message for the given error objects.  This currently
-    just creates error messages for each error individually, and then
-    concatenates them all together with blank lines in between.
+    Create a nice error message for the given error objects.  The per-error
+    messages are separated by blank lines, and all are written into a single
+    line buffer in one pass.
 
     Args:
         errors: An iterable of ValidationError objects which represent some
-            schema validation errors
+            schema validation errors.  May be a lazy iterable, e.g. the result
+            of iter_errors(); it is not materialized into a list first.
         schema: The schema whose validation failed
         location_desc_callback: A callback function used to customize the
             description of the location of errors.  Takes a programmatic "path"
             structure as a sequence of strings/ints, and should return a nice
             one-line string description.  Defaults to a simple generic
             implementation which produces descriptions which aren't very nice.
+        max_errors_per_alternative: The maximum number of errors to describe
+            per oneOf alternative, with a note about how many were suppressed.
+            Defaults to None, meaning no limit.
 
     Returns:
         An error message as a string.
     """
-    messages = [
-        validation_error_to_message(error, schema, location_desc_callback)
-        for error in errors
-    ]
+    if location_desc_callback is None:
+        location_desc_callback = json_path_to_string
+
+    message_lines: list[str] = []
+
+    for error in errors:
+        if message_lines:
+            # Blank separator line between errors; joining below turns it
+            # into the "\n\n" gap the old per-error concatenation produced.
+            message_lines.append("")
+
+        _validation_error_to_message_lines(
+            error,
+            schema,
+            location_desc_callback,
+            message_lines,
+            0,
+            max_errors_per_alternative,
+        )
 
-    combined_message_str = "\n\n".join(messages)
+    combined_message_str = "\n".join(message_lines)
 
     return combined_message_str
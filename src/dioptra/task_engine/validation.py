@@ -14,6 +14,7 @@
 #
 # ACCESS THE FULL CC BY 4.0 LICENSE HERE:
 # https://creativecommons.org/licenses/by/4.0/legalcode
+import functools
 import json
 import pathlib
 from collections.abc import Iterable, Mapping, Sequence
@@ -27,9 +28,76 @@ from dioptra.task_engine.issues import IssueSeverity, IssueType, ValidationIssue
 _SCHEMA_FILENAME = "experiment_schema.json"
 
 
-def _instance_path_to_description(  # noqa: C901
-    instance_path: Sequence[Union[int, str]]
+def _describe_types_location(
+    instance_path: Sequence[Union[int, str]], path_len: int
 ) -> str:
+    """Describe a location within the "types" section."""
+    if path_len == 1:
+        return "types section"
+
+    description = f'definition of type "{instance_path[1]}"'
+    if path_len > 2:
+        # Can't slice a Sequence! :-P
+        def_loc = list(instance_path)[2:]
+        description += " at location " + json_path_to_string(def_loc)
+
+    return description
+
+
+def _describe_parameters_location(
+    instance_path: Sequence[Union[int, str]], path_len: int
+) -> str:
+    """Describe a location within the "parameters" section."""
+    if path_len == 1:
+        return "global parameters section"
+
+    return f'parameter "{instance_path[1]}"'
+
+
+def _describe_tasks_location(
+    instance_path: Sequence[Union[int, str]], path_len: int
+) -> str:
+    """Describe a location within the "tasks" section."""
+    if path_len == 1:
+        return "tasks section"
+
+    description = f'task plugin "{instance_path[1]}"'
+    if path_len > 2:
+        if instance_path[2] == "outputs":
+            description += " outputs"
+        elif instance_path[2] == "inputs":
+            description += " inputs"
+        elif instance_path[2] == "plugin":
+            description += " plugin ID"
+
+    return description
+
+
+def _describe_graph_location(
+    instance_path: Sequence[Union[int, str]], path_len: int
+) -> str:
+    """Describe a location within the "graph" section."""
+    if path_len == 1:
+        return "graph section"
+
+    description = f'step "{instance_path[1]}"'
+    if path_len > 2 and instance_path[2] == "dependencies":
+        description += " dependencies"
+
+    return description
+
+
+# Maps a top-level experiment description section to the formatter for
+# locations within that section.
+_LOCATION_FORMATTERS = {
+    "types": _describe_types_location,
+    "parameters": _describe_parameters_location,
+    "tasks": _describe_tasks_location,
+    "graph": _describe_graph_location,
+}
+
+
+def _instance_path_to_description(instance_path: Sequence[Union[int, str]]) -> str:
     """
     Create a nice description of the location in an experiment description
     pointed to by instance_path.  This implementation is crafted specifically
@@ -44,63 +112,25 @@ def _instance_path_to_description(  # noqa: C901
 
     path_len = len(instance_path)
 
-    message_parts = []
     if path_len == 0:
-        message_parts.append("root level of experiment description")
-
-    else:
-        if instance_path[0] == "types":
-            if path_len == 1:
-                message_parts.append("types section")
-            else:
-                message_parts.append('definition of type "{}"'.format(instance_path[1]))
+        return "root level of experiment description"
 
-                if path_len > 2:
-                    # Can't slice a Sequence! :-P
-                    def_loc = list(instance_path)[2:]
-                    message_parts.append("at location " + json_path_to_string(def_loc))
+    formatter = _LOCATION_FORMATTERS.get(instance_path[0])  # type: ignore[arg-type]
+    if formatter is not None:
+        return formatter(instance_path, path_len)
 
-        elif instance_path[0] == "parameters":
-            if path_len == 1:
-                message_parts.append("global parameters section")
-            else:
-                message_parts.append("parameter")
-                message_parts.append('"{}"'.format(instance_path[1]))
-
-        elif instance_path[0] == "tasks":
-            if path_len == 1:
-                message_parts.append("tasks section")
-            else:
-                message_parts.append('task plugin "' + str(instance_path[1]) + '"')
-                if path_len > 2:
-                    if instance_path[2] == "outputs":
-                        message_parts.append("outputs")
-                    elif instance_path[2] == "inputs":
-                        message_parts.append("inputs")
-                    elif instance_path[2] == "plugin":
-                        message_parts.append("plugin ID")
-
-        elif instance_path[0] == "graph":
-            if path_len == 1:
-                message_parts.append("graph section")
-            else:
-                message_parts.append('step "' + str(instance_path[1]) + '"')
-                if len(instance_path) > 2 and instance_path[2] == "dependencies":
-                    message_parts.append("dependencies")
-
-    if message_parts:
-        description = " ".join(message_parts)
-    else:
-        # fallbacks if we don't know another way of describing the location
-        instance_path_str = json_path_to_string(instance_path)
-        description = "experiment description location " + instance_path_str
-
-    return description
+    # fallback if we don't know another way of describing the location
+    return "experiment description location " + json_path_to_string(instance_path)
 
 
+@functools.lru_cache(maxsize=1)
 def _get_json_schema() -> Union[dict, bool]:  # hypothetical types of schemas
     """
     Read and parse the declarative experiment description JSON-Schema file.
+    The parsed schema is cached, so every validation shares one long-lived
+    schema object.  Besides skipping the repeated file read, that is what
+    makes error_message's identity-keyed caches effective.  Callers must not
+    mutate the returned schema.
 
     Returns:
         The schema, as parsed JSON
@@ -238,7 +268,7 @@ def _check_name_collisions(experiment_desc: Mapping[str, Any]) -> list[Validatio
 
 
 def _check_global_parameter_types(
-    experiment_desc: Mapping[str, Any]
+    experiment_desc: Mapping[str, Any],
 ) -> list[ValidationIssue]:
     """
     Check whether all global parameter types are valid.
@@ -296,7 +326,7 @@ def _check_global_parameter_types(
 
 
 def _check_type_definition_type_references(
-    experiment_desc: Mapping[str, Any]
+    experiment_desc: Mapping[str, Any],
 ) -> list[ValidationIssue]:
     """
     Check for references to undefined types in all type definitions.
@@ -332,7 +362,7 @@ def _check_type_definition_type_references(
 
 
 def _check_type_reference_cycle(
-    experiment_desc: Mapping[str, Any]
+    experiment_desc: Mapping[str, Any],
 ) -> list[ValidationIssue]:
     """
     Check for a reference cycle among type definitions.
@@ -367,7 +397,7 @@ def _check_type_reference_cycle(
 
 
 def _check_union_member_duplicates(
-    experiment_desc: Mapping[str, Any]
+    experiment_desc: Mapping[str, Any],
 ) -> list[ValidationIssue]:
     """
     Check for union type definitions for which there is duplication in the
@@ -422,7 +452,7 @@ def _check_union_member_duplicates(
 
 
 def _check_task_plugin_references(
-    experiment_desc: Mapping[str, Any]
+    experiment_desc: Mapping[str, Any],
 ) -> list[ValidationIssue]:
     """
     Check whether all task plugin short names refer to known task plugins.
@@ -453,7 +483,7 @@ def _check_task_plugin_references(
 
 
 def _check_task_plugin_pyplugs_coords(
-    experiment_desc: Mapping[str, Any]
+    experiment_desc: Mapping[str, Any],
 ) -> list[ValidationIssue]:
     """
     Check task plugin IDs for validity.  They must at minimum include a module
@@ -492,7 +522,7 @@ def _check_task_plugin_pyplugs_coords(
 
 
 def _check_task_plugin_io_names(
-    experiment_desc: Mapping[str, Any]
+    experiment_desc: Mapping[str, Any],
 ) -> list[ValidationIssue]:
     """
     Check task definitions for duplicate input and output names.
@@ -557,7 +587,7 @@ def _check_task_plugin_io_names(
 
 
 def _check_task_plugin_io_types(
-    experiment_desc: Mapping[str, Any]
+    experiment_desc: Mapping[str, Any],
 ) -> list[ValidationIssue]:
     """
     Check task definition input and output type names for validity: whether
@@ -616,7 +646,7 @@ def _check_task_plugin_io_types(
 
 
 def _check_graph_references(  # noqa: C901
-    experiment_desc: Mapping[str, Any]
+    experiment_desc: Mapping[str, Any],
 ) -> list[ValidationIssue]:
     """
     Scan for references within task invocations, check whether they are legal,
@@ -702,7 +732,7 @@ def _check_graph_references(  # noqa: C901
 
 
 def _check_graph_dependencies(
-    experiment_desc: Mapping[str, Any]
+    experiment_desc: Mapping[str, Any],
 ) -> list[ValidationIssue]:
     """
     Check explicitly declared dependencies for each step and ensure they refer
@@ -0,0 +1,167 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import pytest
+
+from dioptra.client import DioptraClient
+
+
+class FakeResponse(object):
+    """A stand-in for a requests Response with a canned JSON payload."""
+
+    def __init__(self, payload: dict[str, Any]) -> None:
+        self._payload = payload
+
+    def json(self) -> dict[str, Any]:
+        return self._payload
+
+
+class FakeSession(object):
+    """A stand-in for a requests Session that records every request.
+
+    Responses echo back the request so tests can assert on what was sent.
+    The request log is guarded by a lock because the client issues some
+    requests from worker threads.
+    """
+
+    def __init__(self) -> None:
+        self.requests: list[tuple[str, str, Any]] = []
+        self._lock = threading.Lock()
+
+    def _record(self, method: str, url: str, json: Any = None) -> FakeResponse:
+        with self._lock:
+            self.requests.append((method, url, json))
+        return FakeResponse({"method": method, "url": url, "json": json})
+
+    def get(self, url: str) -> FakeResponse:
+        return self._record("GET", url)
+
+    def post(self, url: str, json: Any = None) -> FakeResponse:
+        return self._record("POST", url, json)
+
+    def put(self, url: str) -> FakeResponse:
+        return self._record("PUT", url)
+
+    def delete(self, url: str) -> FakeResponse:
+        return self._record("DELETE", url)
+
+
+@pytest.fixture
+def fake_session() -> FakeSession:
+    return FakeSession()
+
+
+@pytest.fixture
+def client(fake_session: FakeSession) -> DioptraClient:
+    client = DioptraClient(address="http://example.org")
+    client._session = fake_session
+    return client
+
+
+def test_register_queues(client: DioptraClient, fake_session: FakeSession) -> None:
+    names = [f"queue{i}" for i in range(5)]
+
+    responses = client.register_queues(names)
+
+    assert [response["json"]["name"] for response in responses] == names
+    assert len(fake_session.requests) == len(names)
+    assert all(method == "POST" for method, _, _ in fake_session.requests)
+
+
+def test_get_queues_by_id(client: DioptraClient, fake_session: FakeSession) -> None:
+    ids = list(range(5))
+
+    responses = client.get_queues_by_id(ids)
+
+    # Responses come back in input order even though the lookups ran in
+    # parallel.
+    assert [response["url"].rsplit("/", 1)[1] for response in responses] == [
+        str(id) for id in ids
+    ]
+    assert len(fake_session.requests) == len(ids)
+
+
+def test_get_jobs_by_id(client: DioptraClient, fake_session: FakeSession) -> None:
+    ids = [f"job-uuid-{i}" for i in range(3)]
+
+    responses = client.get_jobs_by_id(ids)
+
+    assert [response["url"].rsplit("/", 1)[1] for response in responses] == ids
+
+
+def test_get_queue_by_id_async(
+    client: DioptraClient, fake_session: FakeSession
+) -> None:
+    future = client.get_queue_by_id_async(1)
+
+    response = future.result(timeout=10)
+    assert response == client.get_queue_by_id(1)
+
+
+def test_get_job_by_id_async(client: DioptraClient, fake_session: FakeSession) -> None:
+    future = client.get_job_by_id_async("job-uuid-1")
+
+    response = future.result(timeout=10)
+    assert response == client.get_job_by_id("job-uuid-1")
+
+
+def test_get_queue_by_name_is_cached(
+    client: DioptraClient, fake_session: FakeSession
+) -> None:
+    first = client.get_queue_by_name("queue1")
+    second = client.get_queue_by_name("queue1")
+
+    assert first == second
+    assert len(fake_session.requests) == 1
+
+    client.get_queue_by_name("queue1", refresh=True)
+    assert len(fake_session.requests) == 2
+
+
+def test_get_queue_by_name_cache_expires(
+    client: DioptraClient,
+    fake_session: FakeSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from dioptra.client import _client
+
+    now = 0.0
+    monkeypatch.setattr(_client.time, "monotonic", lambda: now)
+
+    client.get_queue_by_name("queue1")
+    client.get_queue_by_name("queue1")
+    assert len(fake_session.requests) == 1
+
+    now = _client.QUEUE_CACHE_TTL_SECONDS + 1.0
+    client.get_queue_by_name("queue1")
+    assert len(fake_session.requests) == 2
+
+
+@pytest.mark.parametrize("invalidate", ["register_queue", "lock_queue", "unlock_queue"])
+def test_get_queue_by_name_cache_invalidation(
+    client: DioptraClient, fake_session: FakeSession, invalidate: str
+) -> None:
+    client.get_queue_by_name("queue1")
+    getattr(client, invalidate)("queue1")
+
+    num_requests = len(fake_session.requests)
+    client.get_queue_by_name("queue1")
+    assert len(fake_session.requests) == num_requests + 1
@@ -16,8 +16,12 @@
 # https://creativecommons.org/licenses/by/4.0/legalcode
 from __future__ import annotations
 
+import gzip
+
 from flask import Flask, Response
 
+LARGE_BODY = b"x" * 2000
+
 
 def test_create_app(app: Flask):
     assert isinstance(app, Flask)
@@ -29,3 +33,44 @@ def test_app_healthy(app: Flask):
         assert resp.status_code == 200
         assert resp.is_json
         assert resp.json == "healthy"
+
+
+def test_app_compresses_large_responses(app: Flask):
+    app.add_url_rule("/large", "large", lambda: LARGE_BODY)
+
+    with app.test_client() as client:
+        resp: Response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+        assert resp.status_code == 200
+        assert resp.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in resp.headers["Vary"]
+        assert gzip.decompress(resp.get_data()) == LARGE_BODY
+
+
+def test_app_compression_respects_accept_encoding(app: Flask):
+    app.add_url_rule("/large", "large", lambda: LARGE_BODY)
+
+    with app.test_client() as client:
+        opt_outs = (
+            {},
+            {"Accept-Encoding": "identity"},
+            {"Accept-Encoding": "gzip;q=0"},
+        )
+        for headers in opt_outs:
+            resp: Response = client.get("/large", headers=headers)
+            assert resp.status_code == 200
+            assert "Content-Encoding" not in resp.headers
+            assert resp.get_data() == LARGE_BODY
+
+
+def test_app_compression_skips_small_and_error_responses(app: Flask):
+    app.add_url_rule("/small", "small", lambda: b"x" * 100)
+    app.add_url_rule("/error", "error", lambda: (LARGE_BODY, 500))
+
+    with app.test_client() as client:
+        resp: Response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+        assert resp.status_code == 200
+        assert "Content-Encoding" not in resp.headers
+
+        resp = client.get("/error", headers={"Accept-Encoding": "gzip"})
+        assert resp.status_code == 500
+        assert "Content-Encoding" not in resp.headers
@@ -759,6 +759,67 @@ def test_manage_queue_snapshots(
     )
 
 
+def test_queue_conditional_get(
+    client: FlaskClient,
+    db: SQLAlchemy,
+    auth_account: dict[str, Any],
+    registered_queues: dict[str, Any],
+    registered_tags: dict[str, Any],
+) -> None:
+    """Test that conditional GET requests for a queue revalidate correctly.
+
+    Given an authenticated user and registered queues, this test validates the following
+    sequence of actions:
+
+    - The user retrieves a queue and receives an ETag header.
+    - The user repeats the request with If-None-Match and receives a 304 with no body.
+    - The user attaches a tag to the queue.
+    - The conditional request with the old ETag now receives a 200 with the tag in the
+      response body, along with a new ETag.
+    - The user renames the queue.
+    - The conditional request with the tag-change ETag also receives a 200.
+    """
+    queue = registered_queues["queue1"]
+    tag = list(registered_tags.values())[0]
+    queue_url = f"/{V1_ROOT}/{V1_QUEUES_ROUTE}/{queue['id']}"
+
+    response = client.get(queue_url, follow_redirects=True)
+    etag = response.headers.get("ETag")
+    assert response.status_code == 200 and etag is not None
+
+    response = client.get(
+        queue_url, headers={"If-None-Match": etag}, follow_redirects=True
+    )
+    assert response.status_code == 304 and response.get_data() == b""
+
+    # Attaching a tag changes the response body without creating a new
+    # snapshot, so the old ETag must no longer validate.
+    actions.append_tags(
+        client,
+        resource_route=V1_QUEUES_ROUTE,
+        resource_id=queue["id"],
+        tag_ids=[tag["id"]],
+    )
+    response = client.get(
+        queue_url, headers={"If-None-Match": etag}, follow_redirects=True
+    )
+    new_etag = response.headers.get("ETag")
+    assert response.status_code == 200
+    assert [tag["id"] for tag in response.get_json()["tags"]] == [tag["id"]]
+    assert new_etag is not None and new_etag != etag
+
+    modify_queue(
+        client,
+        queue_id=queue["id"],
+        new_name=queue["name"] + "modified",
+        new_description=queue["description"],
+    )
+    response = client.get(
+        queue_url, headers={"If-None-Match": new_etag}, follow_redirects=True
+    )
+    assert response.status_code == 200
+
+
 def test_tag_queue(
     client: FlaskClient,
     db: SQLAlchemy,
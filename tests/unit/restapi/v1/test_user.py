@@ -659,6 +659,33 @@ def test_rename_current_user(
     assert_retrieving_current_user_works(client, expected=user)
 
 
+def test_modify_current_user_no_op(
+    client: FlaskClient,
+    db: SQLAlchemy,
+    auth_account: dict[str, Any],
+) -> None:
+    """Test that submitting an unchanged current user profile skips the update.
+
+    Given an authenticated user, this test validates the following sequence of actions:
+
+    - A user submits a modification with its current username and email.
+    - The request succeeds and responds with the unchanged user.
+    - The last modified timestamp is unchanged, showing no database write happened.
+    """
+    response = client.get(f"/{V1_ROOT}/{V1_USERS_ROUTE}/current", follow_redirects=True)
+    user_before = response.get_json()
+
+    response = modify_current_user(
+        client, auth_account["username"], auth_account["email"]
+    )
+    assert response.status_code == 200
+
+    response = client.get(f"/{V1_ROOT}/{V1_USERS_ROUTE}/current", follow_redirects=True)
+    user_after = response.get_json()
+    assert user_after["username"] == auth_account["username"]
+    assert user_after["lastModifiedOn"] == user_before["lastModifiedOn"]
+
+
 def test_user_authorization_failure(
     client: FlaskClient,
     db: SQLAlchemy,
@@ -0,0 +1,78 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+import jsonschema.validators
+import pytest
+
+from dioptra.task_engine.error_message import validation_errors_to_message
+
+# A oneOf schema where an object instance can fail both alternatives with
+# several errors each.
+ONE_OF_SCHEMA = {
+    "oneOf": [
+        {
+            "title": "Alpha",
+            "type": "object",
+            "properties": {"x": {"type": "string"}, "y": {"type": "number"}},
+            "required": ["x", "y"],
+            "additionalProperties": False,
+        },
+        {"title": "Beta", "type": "array"},
+    ]
+}
+
+
+def _get_errors(schema, instance):
+    validator_class = jsonschema.validators.validator_for(schema)
+    return list(validator_class(schema).iter_errors(instance))
+
+
+def test_no_alternatives_satisfied_message() -> None:
+    errors = _get_errors(ONE_OF_SCHEMA, {"x": 1, "y": "s", "z": 0})
+    message = validation_errors_to_message(errors, ONE_OF_SCHEMA)
+
+    assert 'Errors associated with alternative "Alpha"' in message
+    assert 'Errors associated with alternative "Beta"' in message
+    # All three "Alpha" sub-errors are described by default.
+    assert "'string'" in message
+    assert "'number'" in message
+    assert "Additional properties" in message
+    assert "suppressed" not in message
+
+
+@pytest.mark.parametrize("max_errors", [1, 2])
+def test_max_errors_per_alternative(max_errors) -> None:
+    errors = _get_errors(ONE_OF_SCHEMA, {"x": 1, "y": "s", "z": 0})
+    message = validation_errors_to_message(
+        errors, ONE_OF_SCHEMA, max_errors_per_alternative=max_errors
+    )
+
+    num_suppressed = 3 - max_errors
+    assert f"... ({num_suppressed} more suppressed)" in message
+    # "Beta" only has one sub-error, so nothing is suppressed there and the
+    # message contains exactly one suppression note.
+    assert message.count("suppressed") == 1
+
+
+def test_max_errors_per_alternative_no_limit() -> None:
+    errors = _get_errors(ONE_OF_SCHEMA, {"x": 1, "y": "s", "z": 0})
+
+    unlimited = validation_errors_to_message(
+        errors, ONE_OF_SCHEMA, max_errors_per_alternative=None
+    )
+    default = validation_errors_to_message(errors, ONE_OF_SCHEMA)
+
+    assert unlimited == default